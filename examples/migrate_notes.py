@@ -1,8 +1,10 @@
 """Migrate notes from ST json export to ST instance"""
 
+import asyncio
 import logging
+from typing import Final
 
-from solidaritytechtools import STClient
+from solidaritytechtools import STAsyncClient
 from solidaritytechtools.client.models import UserNoteCreate
 from solidaritytechtools.json_export.export import STJsonExport
 from solidaritytechtools.match_persons.match_persons import ClientUserMatch, find_best_match
@@ -13,51 +15,71 @@ logger = logging.getLogger(__name__)
 API_KEY = "..."
 EXPORT_FILE_PATH = "..."
 
+# Keep this below the ST rate limit; requests beyond it just get throttled
+MAX_CONCURRENT_REQUESTS: Final[int] = 20
 
-def migrate_notes(*, dry_run: bool = False):
+
+async def migrate_notes(*, dry_run: bool = False) -> None:
     logger.info("Fetching users and matching data...")
-    best_matches: dict[int, ClientUserMatch | None] = find_best_match(EXPORT_FILE_PATH, API_KEY)
+    # Matching and loading the export are blocking, so keep them off the event loop
+    best_matches: dict[int, ClientUserMatch | None] = await asyncio.to_thread(
+        find_best_match, EXPORT_FILE_PATH, API_KEY
+    )
 
     # Load the full export data (to get the actual content of the notes)
-    export = STJsonExport.from_path(EXPORT_FILE_PATH)
+    export = await asyncio.to_thread(STJsonExport.from_path, EXPORT_FILE_PATH)
 
-    # Connect to the API and migrate notes
-    with STClient(api_key=API_KEY) as client:
-        for person in export.people:
-            match: ClientUserMatch | None = best_matches.get(person.id)
+    notes_to_create: list[UserNoteCreate] = []
+    for person in export.people:
+        match: ClientUserMatch | None = best_matches.get(person.id)
 
-            # Check if we found a confident match for this person
-            if not match:
-                logger.warning(f"Skipping json:{person.id}: No match found in ST.")
-                continue
+        # Check if we found a confident match for this person
+        if not match:
+            logger.warning(f"Skipping json:{person.id}: No match found in ST.")
+            continue
+
+        if not person.notes:
+            continue
+
+        logger.info(
+            f"Migrating {len(person.notes)} notes for json:{person.id} > client:{match.user_id}..."
+        )
+        logger.debug(f"Source notes: {person.notes}")
 
-            if not person.notes:
+        for note_item in person.notes:
+            if dry_run:
+                logger.info(
+                    "[DRY RUN] Would have created note: user_id=%s created_at=%s",
+                    match.user_id,
+                    note_item.created_at,
+                )
                 continue
 
-            logger.info(
-                f"Migrating {len(person.notes)} notes for "
-                f"json:{person.id} > client:{match.user_id}..."
+            # We use the matched live user_id
+            # and preserve the original creation date from the export
+            notes_to_create.append(
+                UserNoteCreate(
+                    user_id=match.user_id,
+                    content=note_item.content,
+                    created_at=int(note_item.created_at.timestamp()),
+                )
             )
-            logger.debug(f"Source notes: {person.notes}")
-
-            for note_item in person.notes:
-                try:
-                    # We use the matched live user_id
-                    # and preserve the original creation date from the export
-                    note_create = UserNoteCreate(
-                        user_id=match.user_id,
-                        content=note_item.content,
-                        created_at=int(note_item.created_at.timestamp()),
-                    )
-                    if dry_run:
-                        logger.info(f"[DRY RUN] Would have created note: {note_create}")
-                    else:
-                        client.create_user_note(note_create)
-                except Exception as e:
-                    logger.error(f"  Failed to copy note for user {match.user_id}: {e}")
+
+    if not notes_to_create:
+        return
+
+    # Connect to the API and create the notes concurrently
+    async with STAsyncClient(api_key=API_KEY) as client:
+        results = await client.create_user_notes(
+            notes_to_create, max_concurrency=MAX_CONCURRENT_REQUESTS
+        )
+
+    for note_create, error in results:
+        if error:
+            logger.error(f"  Failed to copy note for user {note_create.user_id}: {error}")
 
 
 if __name__ == "__main__":
     # Configure logging to show info messages by default
     logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
-    migrate_notes(dry_run=True)
+    asyncio.run(migrate_notes(dry_run=True))
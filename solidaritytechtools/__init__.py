@@ -1,4 +1,5 @@
 from solidaritytechtools.client import models
+from solidaritytechtools.client.async_client import STAsyncClient
 from solidaritytechtools.client.base_client import STClient
 from solidaritytechtools.json_export.export import (
     STJsonExport,
@@ -12,6 +13,7 @@ from solidaritytechtools.match_persons.match_persons import (
 
 __all__ = [
     "STClient",
+    "STAsyncClient",
     "models",
     "STJsonExport",
     "get_persons_from_json_export",
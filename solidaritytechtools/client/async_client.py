@@ -0,0 +1,908 @@
+"""Asyncio counterpart of `STClient`, for issuing many API calls concurrently."""
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Coroutine
+from typing import Any, TypeVar
+
+import httpx
+from pydantic import BaseModel
+
+from solidaritytechtools.client.base_client import (
+    DEFAULT_BASE_URL,
+    DEFAULT_BULK_CONCURRENCY,
+    DEFAULT_CONNECT_BACKOFF,
+    DEFAULT_CONNECT_RETRIES,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_PAGE_CONCURRENCY,
+    DEFAULT_TIMEOUT,
+    MAX_PAGE_SIZE,
+    BaseSTClient,
+    STError,
+)
+from solidaritytechtools.client.models import (
+    Activity,
+    AgentAssignment,
+    AgentAssignmentCreate,
+    AgentAssignmentUpdate,
+    AutomationEnrollmentCreate,
+    Call,
+    Chapter,
+    ChapterPhoneNumber,
+    CustomUserProperty,
+    CustomUserPropertyCreate,
+    CustomUserPropertyOptionCreate,
+    DonationCharge,
+    EmailBlast,
+    EmailSender,
+    Event,
+    EventAttendance,
+    EventAttendanceCreate,
+    EventRsvp,
+    EventRsvpCreate,
+    EventRsvpUpdate,
+    EventSession,
+    EventSessionCreate,
+    EventSessionUpdate,
+    FieldSurveyUrlResponse,
+    Organization,
+    Page,
+    PaginatedResponse,
+    Phonebank,
+    RelationshipType,
+    ScheduledCall,
+    ScheduledTask,
+    ScheduledTaskCreate,
+    ScheduledTaskUpdate,
+    TaskAgent,
+    TaskAssignment,
+    TeamMember,
+    TeamMemberCreate,
+    TeamMemberUpdate,
+    Text,
+    Textbank,
+    TextBlast,
+    TextTemplate,
+    TextTemplateCreate,
+    TextTemplateUpdate,
+    User,
+    UserActionCreate,
+    UserCreate,
+    UserList,
+    UserListCreate,
+    UserListUpdate,
+    UserNoteCreate,
+    UserRelationshipCreate,
+    UserUpdate,
+)
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class STAsyncClient(BaseSTClient):
+    """
+    Async version of `STClient` built on `httpx.AsyncClient`.
+
+    Every endpoint method mirrors `STClient` but must be awaited, so independent calls can be
+    run concurrently with `asyncio.gather`:
+
+    ```python
+    async with STAsyncClient(api_key="...") as client:
+        users = await asyncio.gather(*(client.get_user(user_id) for user_id in user_ids))
+    ```
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = DEFAULT_BASE_URL,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        cache_ttl: float | None = None,
+        trusted: bool = False,
+    ):
+        super().__init__(
+            api_key,
+            base_url=base_url,
+            timeout=timeout,
+            max_connections=max_connections,
+            max_retries=max_retries,
+            cache_ttl=cache_ttl,
+            trusted=trusted,
+        )
+        self.client = httpx.AsyncClient(**self._client_kwargs())
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        await self.client.aclose()
+
+    async def _request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        attempt = connect_attempt = 0
+        while True:
+            try:
+                response = await self.client.request(method, path, **kwargs)
+            except httpx.ConnectError:
+                if connect_attempt >= DEFAULT_CONNECT_RETRIES:
+                    raise
+                await asyncio.sleep(DEFAULT_CONNECT_BACKOFF * 2**connect_attempt)
+                connect_attempt += 1
+                continue
+            if not self._should_retry(response, attempt):
+                return self._handle_response(response)
+            await asyncio.sleep(self._retry_delay(response, attempt))
+            attempt += 1
+
+    async def _get(self, path: str, params: dict | None = None) -> httpx.Response:
+        return await self._request("GET", path, params=params)
+
+    async def _post(
+        self,
+        path: str,
+        json: dict | BaseModel | None = None,
+        params: dict | None = None,
+    ) -> httpx.Response:
+        return await self._request("POST", path, params=params, **self._body_kwargs(json))
+
+    async def _put(self, path: str, json: dict | BaseModel | None = None) -> httpx.Response:
+        return await self._request("PUT", path, **self._body_kwargs(json))
+
+    async def _delete(self, path: str, params: dict | None = None) -> httpx.Response:
+        return await self._request("DELETE", path, params=params)
+
+    async def _get_cached_item(self, path: str, model_class: type[T], pin: bool = False) -> T:
+        if (item := self._cache_lookup(path)) is not None:
+            return item
+        item = self._parse_item(await self._get(path), model_class)
+        self._cache_store(path, item, pin)
+        return item
+
+    async def _paginate(
+        self,
+        fetch_page: Callable[..., Coroutine[Any, Any, PaginatedResponse[T]]],
+        page_size: int = MAX_PAGE_SIZE,
+        concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+        **filters: Any,
+    ) -> AsyncIterator[T]:
+        """
+        Yields every item of a list endpoint, requesting `page_size` items per round trip.
+
+        When the first page reports a total count, the remaining pages are fetched up to
+        `concurrency` at a time ahead of the caller and yielded in order.
+        """
+        page = await fetch_page(limit=page_size, offset=0, **filters)
+        for item in page.data:
+            yield item
+        offset = server_page_size = len(page.data)
+        # A short first page may just be the server capping `page_size`, so don't stop on it
+        if self._is_last_page(page, offset, None):
+            return
+
+        offsets = self._remaining_offsets(page)
+        if offsets is None or concurrency <= 1:
+            while True:
+                page = await fetch_page(limit=page_size, offset=offset, **filters)
+                for item in page.data:
+                    yield item
+                offset += len(page.data)
+                if self._is_last_page(page, offset, server_page_size):
+                    return
+
+        pending: deque[asyncio.Task[PaginatedResponse[T]]] = deque()
+        try:
+            for offset in offsets:
+                pending.append(
+                    asyncio.create_task(fetch_page(limit=page_size, offset=offset, **filters))
+                )
+                if len(pending) >= concurrency:
+                    for item in (await pending.popleft()).data:
+                        yield item
+            while pending:
+                for item in (await pending.popleft()).data:
+                    yield item
+        finally:
+            # Don't leave prefetched pages running if the caller stops early
+            for task in pending:
+                task.cancel()
+            # Wait for the cancellations so no task is destroyed while still pending
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    # --- Users ---
+
+    async def get_users(
+        self, limit: int = 20, offset: int = 0, since: int = 0, user_list_ids: str | None = None
+    ) -> PaginatedResponse[User]:
+        params = self._build_params(limit, offset, since, user_list_ids=user_list_ids)
+        return self._parse_paginated(await self._get("/users", params=params), User)
+
+    def iter_users(
+        self, since: int = 0, user_list_ids: str | None = None, page_size: int = MAX_PAGE_SIZE
+    ) -> AsyncIterator[User]:
+        return self._paginate(self.get_users, page_size, since=since, user_list_ids=user_list_ids)
+
+    async def get_all_users(
+        self, since: int = 0, user_list_ids: str | None = None, page_size: int = MAX_PAGE_SIZE
+    ) -> list[User]:
+        return [
+            item
+            async for item in self.iter_users(
+                since=since, user_list_ids=user_list_ids, page_size=page_size
+            )
+        ]
+
+    async def get_user(self, user_id: int) -> User:
+        return await self._get_cached_item(f"/users/{user_id}", User)
+
+    async def get_users_by_ids(
+        self, user_ids: list[int], max_concurrency: int = DEFAULT_BULK_CONCURRENCY
+    ) -> list[User]:
+        """Fetches many users concurrently, with up to `max_concurrency` requests in flight."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def get(user_id: int) -> User:
+            async with semaphore:
+                return await self.get_user(user_id)
+
+        return await asyncio.gather(*(get(user_id) for user_id in user_ids))
+
+    async def create_user(self, data: UserCreate | dict) -> User:
+        return self._parse_item(await self._post("/users", json=data), User)
+
+    async def update_user(self, user_id: int, data: UserUpdate | dict) -> User:
+        user = self._parse_item(await self._put(f"/users/{user_id}", json=data), User)
+        self._cache_store(f"/users/{user_id}", user)
+        return user
+
+    async def prefetch_users(self, since: int = 0, user_list_ids: str | None = None) -> None:
+        """
+        Loads users into the client's cache with a few large paginated requests, so that
+        subsequent `get_user_cached` calls don't each need their own round trip.
+        """
+        async for user in self.iter_users(since=since, user_list_ids=user_list_ids):
+            self._cache_store(f"/users/{user.id}", user, pin=True)
+
+    async def get_user_cached(self, user_id: int) -> User:
+        """Returns a user from the prefetch cache, fetching (and caching) it on a miss."""
+        return await self._get_cached_item(f"/users/{user_id}", User, pin=True)
+
+    # --- Activities ---
+
+    async def get_activities(
+        self, limit: int = 20, offset: int = 0, since: int = 0, user_id: int | None = None
+    ) -> PaginatedResponse[Activity]:
+        params = self._build_params(limit, offset, since, user_id=user_id)
+        return self._parse_paginated(await self._get("/activities", params=params), Activity)
+
+    def iter_activities(
+        self, since: int = 0, user_id: int | None = None, page_size: int = MAX_PAGE_SIZE
+    ) -> AsyncIterator[Activity]:
+        return self._paginate(self.get_activities, page_size, since=since, user_id=user_id)
+
+    async def get_all_activities(
+        self, since: int = 0, user_id: int | None = None, page_size: int = MAX_PAGE_SIZE
+    ) -> list[Activity]:
+        return [
+            item
+            async for item in self.iter_activities(
+                since=since, user_id=user_id, page_size=page_size
+            )
+        ]
+
+    # --- Agent Assignments ---
+
+    async def get_agent_assignments(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        since: int = 0,
+        user_id: int | None = None,
+        agent_user_id: int | None = None,
+    ) -> PaginatedResponse[AgentAssignment]:
+        params = self._build_params(
+            limit, offset, since, user_id=user_id, agent_user_id=agent_user_id
+        )
+        return self._parse_paginated(
+            await self._get("/agent_assignments", params=params), AgentAssignment
+        )
+
+    async def get_agent_assignment(self, assignment_id: int) -> AgentAssignment:
+        return self._parse_item(
+            await self._get(f"/agent_assignments/{assignment_id}"), AgentAssignment
+        )
+
+    async def create_agent_assignment(self, data: AgentAssignmentCreate | dict) -> AgentAssignment:
+        return self._parse_item(await self._post("/agent_assignments", json=data), AgentAssignment)
+
+    async def update_agent_assignment(
+        self, assignment_id: int, data: AgentAssignmentUpdate | dict
+    ) -> AgentAssignment:
+        return self._parse_item(
+            await self._put(f"/agent_assignments/{assignment_id}", json=data), AgentAssignment
+        )
+
+    async def delete_agent_assignment(self, assignment_id: int):
+        await self._delete(f"/agent_assignments/{assignment_id}")
+
+    # --- Calls ---
+
+    async def get_calls(
+        self, limit: int = 20, offset: int = 0, since: int = 0, user_id: int | None = None
+    ) -> PaginatedResponse[Call]:
+        params = self._build_params(limit, offset, since, user_id=user_id)
+        return self._parse_paginated(await self._get("/calls", params=params), Call)
+
+    def iter_calls(
+        self, since: int = 0, user_id: int | None = None, page_size: int = MAX_PAGE_SIZE
+    ) -> AsyncIterator[Call]:
+        return self._paginate(self.get_calls, page_size, since=since, user_id=user_id)
+
+    async def get_all_calls(
+        self, since: int = 0, user_id: int | None = None, page_size: int = MAX_PAGE_SIZE
+    ) -> list[Call]:
+        return [
+            item
+            async for item in self.iter_calls(since=since, user_id=user_id, page_size=page_size)
+        ]
+
+    # --- Chapters ---
+
+    async def get_chapters(
+        self, limit: int = 20, offset: int = 0, since: int = 0
+    ) -> PaginatedResponse[Chapter]:
+        params = self._build_params(limit, offset, since)
+        return self._parse_paginated(await self._get("/chapters", params=params), Chapter)
+
+    async def get_chapter_phone_numbers(
+        self, limit: int = 20, offset: int = 0, since: int = 0, chapter_id: int | None = None
+    ) -> PaginatedResponse[ChapterPhoneNumber]:
+        params = self._build_params(limit, offset, since, chapter_id=chapter_id)
+        return self._parse_paginated(
+            await self._get("/chapter_phone_numbers", params=params), ChapterPhoneNumber
+        )
+
+    # --- Custom User Properties ---
+
+    async def get_custom_user_properties(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        since: int = 0,
+        scope_id: int | None = None,
+        scope_type: str | None = None,
+    ) -> PaginatedResponse[CustomUserProperty]:
+        params = self._build_params(limit, offset, since, scope_id=scope_id, scope_type=scope_type)
+        return self._parse_paginated(
+            await self._get("/custom_user_properties", params=params), CustomUserProperty
+        )
+
+    async def create_custom_user_property(
+        self, data: CustomUserPropertyCreate | dict
+    ) -> CustomUserProperty:
+        return self._parse_item(
+            await self._post("/custom_user_properties", json=data), CustomUserProperty
+        )
+
+    async def create_custom_user_property_option(
+        self, property_id: int, data: CustomUserPropertyOptionCreate | dict
+    ) -> CustomUserProperty:
+        return self._parse_item(
+            await self._post(f"/custom_user_properties/{property_id}/options", json=data),
+            CustomUserProperty,
+        )
+
+    async def delete_custom_user_property_option(
+        self, property_id: int, option_value: str
+    ) -> CustomUserProperty:
+        return self._parse_item(
+            await self._delete(f"/custom_user_properties/{property_id}/options/{option_value}"),
+            CustomUserProperty,
+        )
+
+    # --- Donation Charges ---
+
+    async def get_donation_charges(
+        self, limit: int = 20, offset: int = 0, since: int = 0
+    ) -> PaginatedResponse[DonationCharge]:
+        params = self._build_params(limit, offset, since)
+        return self._parse_paginated(
+            await self._get("/donation_charges", params=params), DonationCharge
+        )
+
+    async def get_donation_charge(self, charge_id: int) -> DonationCharge:
+        return await self._get_cached_item(f"/donation_charges/{charge_id}", DonationCharge)
+
+    # --- Events ---
+
+    async def get_events(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        since: int = 0,
+        scope_id: int | None = None,
+        scope_type: str | None = None,
+    ) -> PaginatedResponse[Event]:
+        params = self._build_params(limit, offset, since, scope_id=scope_id, scope_type=scope_type)
+        return self._parse_paginated(await self._get("/events", params=params), Event)
+
+    def iter_events(
+        self,
+        since: int = 0,
+        scope_id: int | None = None,
+        scope_type: str | None = None,
+        page_size: int = MAX_PAGE_SIZE,
+    ) -> AsyncIterator[Event]:
+        return self._paginate(
+            self.get_events, page_size, since=since, scope_id=scope_id, scope_type=scope_type
+        )
+
+    async def get_all_events(
+        self,
+        since: int = 0,
+        scope_id: int | None = None,
+        scope_type: str | None = None,
+        page_size: int = MAX_PAGE_SIZE,
+    ) -> list[Event]:
+        return [
+            item
+            async for item in self.iter_events(
+                since=since, scope_id=scope_id, scope_type=scope_type, page_size=page_size
+            )
+        ]
+
+    async def get_event(self, event_id: int) -> Event:
+        return await self._get_cached_item(f"/events/{event_id}", Event)
+
+    async def get_event_sessions(
+        self, limit: int = 20, offset: int = 0, since: int = 0, event_id: int | None = None
+    ) -> PaginatedResponse[EventSession]:
+        params = self._build_params(limit, offset, since, event_id=event_id)
+        return self._parse_paginated(
+            await self._get("/event_sessions", params=params), EventSession
+        )
+
+    async def get_event_session(self, session_id: int) -> EventSession:
+        return self._parse_item(await self._get(f"/event_sessions/{session_id}"), EventSession)
+
+    async def create_event_session(self, data: EventSessionCreate | dict) -> EventSession:
+        return self._parse_item(await self._post("/event_sessions", json=data), EventSession)
+
+    async def update_event_session(
+        self, session_id: int, data: EventSessionUpdate | dict
+    ) -> EventSession:
+        return self._parse_item(
+            await self._put(f"/event_sessions/{session_id}", json=data), EventSession
+        )
+
+    async def delete_event_session(self, session_id: int):
+        await self._delete(f"/event_sessions/{session_id}")
+
+    async def get_event_rsvps(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        since: int = 0,
+        event_id: int | None = None,
+        session_id: int | None = None,
+    ) -> PaginatedResponse[EventRsvp]:
+        params = self._build_params(limit, offset, since, event_id=event_id, session_id=session_id)
+        return self._parse_paginated(await self._get("/event_rsvps", params=params), EventRsvp)
+
+    def iter_event_rsvps(
+        self,
+        since: int = 0,
+        event_id: int | None = None,
+        session_id: int | None = None,
+        page_size: int = MAX_PAGE_SIZE,
+    ) -> AsyncIterator[EventRsvp]:
+        return self._paginate(
+            self.get_event_rsvps, page_size, since=since, event_id=event_id, session_id=session_id
+        )
+
+    async def get_all_event_rsvps(
+        self,
+        since: int = 0,
+        event_id: int | None = None,
+        session_id: int | None = None,
+        page_size: int = MAX_PAGE_SIZE,
+    ) -> list[EventRsvp]:
+        return [
+            item
+            async for item in self.iter_event_rsvps(
+                since=since, event_id=event_id, session_id=session_id, page_size=page_size
+            )
+        ]
+
+    async def get_event_rsvp(self, rsvp_id: int) -> EventRsvp:
+        return self._parse_item(await self._get(f"/event_rsvps/{rsvp_id}"), EventRsvp)
+
+    async def create_event_rsvp(self, data: EventRsvpCreate | dict) -> EventRsvp:
+        return self._parse_item(await self._post("/event_rsvps", json=data), EventRsvp)
+
+    async def update_event_rsvp(self, rsvp_id: int, data: EventRsvpUpdate | dict) -> EventRsvp:
+        return self._parse_item(await self._put(f"/event_rsvps/{rsvp_id}", json=data), EventRsvp)
+
+    async def delete_event_rsvp(self, rsvp_id: int):
+        await self._delete(f"/event_rsvps/{rsvp_id}")
+
+    async def get_event_attendances(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        since: int = 0,
+        event_id: int | None = None,
+        session_id: int | None = None,
+    ) -> PaginatedResponse[EventAttendance]:
+        params = self._build_params(limit, offset, since, event_id=event_id, session_id=session_id)
+        return self._parse_paginated(
+            await self._get("/event_attendances", params=params), EventAttendance
+        )
+
+    def iter_event_attendances(
+        self,
+        since: int = 0,
+        event_id: int | None = None,
+        session_id: int | None = None,
+        page_size: int = MAX_PAGE_SIZE,
+    ) -> AsyncIterator[EventAttendance]:
+        return self._paginate(
+            self.get_event_attendances,
+            page_size,
+            since=since,
+            event_id=event_id,
+            session_id=session_id,
+        )
+
+    async def get_all_event_attendances(
+        self,
+        since: int = 0,
+        event_id: int | None = None,
+        session_id: int | None = None,
+        page_size: int = MAX_PAGE_SIZE,
+    ) -> list[EventAttendance]:
+        return [
+            item
+            async for item in self.iter_event_attendances(
+                since=since, event_id=event_id, session_id=session_id, page_size=page_size
+            )
+        ]
+
+    async def create_event_attendance(self, data: EventAttendanceCreate | dict) -> EventAttendance:
+        return self._parse_item(await self._post("/event_attendances", json=data), EventAttendance)
+
+    async def delete_event_attendance(self, attendance_id: int):
+        await self._delete(f"/event_attendances/{attendance_id}")
+
+    # --- User Actions ---
+
+    async def get_user_actions(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        since: int = 0,
+        user_id: int | None = None,
+        page_id: int | None = None,
+    ) -> PaginatedResponse[Any]:
+        params = self._build_params(limit, offset, since, user_id=user_id, page_id=page_id)
+        # Spec doesn't define response schema for GET /user_actions, assuming paginated
+        return self._parse_paginated(await self._get("/user_actions", params=params), BaseModel)
+
+    async def submit_user_action(self, data: UserActionCreate | dict):
+        await self._post("/user_actions", json=data)
+
+    # --- Messaging ---
+
+    async def get_texts(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        since: str | None = None,
+        user_id: int | None = None,
+    ) -> PaginatedResponse[Text]:
+        params = self._build_params(limit, offset, since, user_id=user_id)
+        return self._parse_paginated(await self._get("/texts", params=params), Text)
+
+    def iter_texts(
+        self, since: str | None = None, user_id: int | None = None, page_size: int = MAX_PAGE_SIZE
+    ) -> AsyncIterator[Text]:
+        return self._paginate(self.get_texts, page_size, since=since, user_id=user_id)
+
+    async def get_all_texts(
+        self, since: str | None = None, user_id: int | None = None, page_size: int = MAX_PAGE_SIZE
+    ) -> list[Text]:
+        return [
+            item
+            async for item in self.iter_texts(since=since, user_id=user_id, page_size=page_size)
+        ]
+
+    async def create_text(self, user_id: int, body: str, media_urls: list[str] | None = None):
+        params: dict[str, Any] = {"user_id": user_id, "body": body}
+        if media_urls:
+            params["media_urls"] = media_urls
+        await self._post("/texts", params=params)
+
+    async def send_email(self, user_id: int, subject: str, body_html: str, **kwargs):
+        params = {"user_id": user_id, "subject": subject, "body_html": body_html, **kwargs}
+        await self._post("/emails", params=params)
+
+    async def get_email_senders(
+        self, limit: int = 20, offset: int = 0
+    ) -> PaginatedResponse[EmailSender]:
+        params = self._build_params(limit, offset)
+        return self._parse_paginated(await self._get("/email_senders", params=params), EmailSender)
+
+    async def get_email_blasts(
+        self, limit: int = 20, offset: int = 0, since: int = 0
+    ) -> PaginatedResponse[EmailBlast]:
+        params = self._build_params(limit, offset, since)
+        return self._parse_paginated(await self._get("/email_blasts", params=params), EmailBlast)
+
+    async def get_email_blast(self, blast_id: int) -> EmailBlast:
+        return await self._get_cached_item(f"/email_blasts/{blast_id}", EmailBlast)
+
+    # --- Scheduled Tasks ---
+
+    async def get_scheduled_tasks(
+        self, limit: int = 20, offset: int = 0, since: int = 0, user_id: int | None = None
+    ) -> PaginatedResponse[ScheduledTask]:
+        params = self._build_params(limit, offset, since, user_id=user_id)
+        return self._parse_paginated(
+            await self._get("/scheduled_tasks", params=params), ScheduledTask
+        )
+
+    async def get_scheduled_task(self, task_id: int) -> ScheduledTask:
+        return self._parse_item(await self._get(f"/scheduled_tasks/{task_id}"), ScheduledTask)
+
+    async def create_scheduled_task(self, data: ScheduledTaskCreate | dict) -> ScheduledTask:
+        return self._parse_item(await self._post("/scheduled_tasks", json=data), ScheduledTask)
+
+    async def update_scheduled_task(
+        self, task_id: int, data: ScheduledTaskUpdate | dict
+    ) -> ScheduledTask:
+        return self._parse_item(
+            await self._put(f"/scheduled_tasks/{task_id}", json=data), ScheduledTask
+        )
+
+    async def delete_scheduled_task(self, task_id: int):
+        await self._delete(f"/scheduled_tasks/{task_id}")
+
+    # --- User Notes ---
+
+    async def create_user_note(self, data: UserNoteCreate | dict):
+        await self._post("/user_notes", params=self._to_dict(data))
+
+    async def create_user_notes(
+        self,
+        notes: list[UserNoteCreate | dict],
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> list[tuple[UserNoteCreate | dict, Exception | None]]:
+        """
+        Creates many notes concurrently, with up to `max_concurrency` requests in flight.
+
+        Returns each note paired with the error raised while creating it (or None on success),
+        so a single failure doesn't abort the rest of the batch.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        create_user_note = self.create_user_note
+
+        async def create(note: UserNoteCreate | dict) -> Exception | None:
+            async with semaphore:
+                try:
+                    await create_user_note(note)
+                except (STError, httpx.HTTPError) as e:
+                    return e
+            return None
+
+        results = await asyncio.gather(*(create(note) for note in notes))
+        return list(zip(notes, results, strict=True))
+
+    async def delete_user_note(self, note_id: int, user_id: int):
+        await self._delete(f"/user_notes/{note_id}", params={"user_id": user_id})
+
+    # --- Organizations ---
+
+    async def get_organizations(
+        self, limit: int = 20, offset: int = 0, since: int = 0
+    ) -> PaginatedResponse[Organization]:
+        params = self._build_params(limit, offset, since)
+        return self._parse_paginated(await self._get("/organizations", params=params), Organization)
+
+    async def get_organization(self, org_id: int) -> Organization:
+        return await self._get_cached_item(f"/organizations/{org_id}", Organization)
+
+    # --- Automations ---
+
+    async def enroll_in_automation(self, data: AutomationEnrollmentCreate | dict):
+        await self._post("/automation_enrollments", json=data)
+
+    # --- User Lists ---
+
+    async def get_user_lists(
+        self, limit: int = 20, offset: int = 0, since: int = 0
+    ) -> PaginatedResponse[UserList]:
+        params = self._build_params(limit, offset, since)
+        return self._parse_paginated(await self._get("/user_lists", params=params), UserList)
+
+    async def create_user_list(self, data: UserListCreate | dict) -> UserList:
+        return self._parse_item(await self._post("/user_lists", json=data), UserList)
+
+    async def get_user_list(self, list_id: int) -> UserList:
+        return self._parse_item(await self._get(f"/user_lists/{list_id}"), UserList)
+
+    async def update_user_list(self, list_id: int, data: UserListUpdate | dict) -> UserList:
+        return self._parse_item(await self._put(f"/user_lists/{list_id}", json=data), UserList)
+
+    async def delete_user_list(self, list_id: int):
+        await self._delete(f"/user_lists/{list_id}")
+
+    # --- Relationships ---
+
+    async def get_relationship_types(self, user_id: int) -> list[RelationshipType]:
+        response = await self._get("/user_relationships", params={"user_id": user_id})
+        return self._parse_list(response, RelationshipType)
+
+    async def create_user_relationship(self, data: UserRelationshipCreate | dict):
+        await self._post("/user_relationships", params=self._to_dict(data))
+
+    async def delete_user_relationship(self, relationship_id: int, user_id: int):
+        await self._delete(f"/user_relationships/{relationship_id}", params={"user_id": user_id})
+
+    # --- Team Members ---
+
+    async def get_team_members(
+        self, limit: int = 20, offset: int = 0, since: int = 0
+    ) -> PaginatedResponse[TeamMember]:
+        params = self._build_params(limit, offset, since)
+        return self._parse_paginated(await self._get("/team_members", params=params), TeamMember)
+
+    async def create_team_member(self, data: TeamMemberCreate | dict) -> TeamMember:
+        return self._parse_item(await self._post("/team_members", json=data), TeamMember)
+
+    async def update_team_member(self, member_id: int, data: TeamMemberUpdate | dict) -> TeamMember:
+        return self._parse_item(
+            await self._put(f"/team_members/{member_id}", json=data), TeamMember
+        )
+
+    # --- Text Templates ---
+
+    async def get_text_templates(
+        self, limit: int = 20, offset: int = 0, since: int = 0, event_id: int | None = None
+    ) -> PaginatedResponse[TextTemplate]:
+        params = self._build_params(limit, offset, since, event_id=event_id)
+        return self._parse_paginated(
+            await self._get("/text_templates", params=params), TextTemplate
+        )
+
+    async def get_text_template(self, template_id: int) -> TextTemplate:
+        return self._parse_item(await self._get(f"/text_templates/{template_id}"), TextTemplate)
+
+    async def create_text_template(self, data: TextTemplateCreate | dict) -> TextTemplate:
+        return self._parse_item(await self._post("/text_templates", json=data), TextTemplate)
+
+    async def update_text_template(
+        self, template_id: int, data: TextTemplateUpdate | dict
+    ) -> TextTemplate:
+        return self._parse_item(
+            await self._put(f"/text_templates/{template_id}", json=data), TextTemplate
+        )
+
+    async def delete_text_template(self, template_id: int):
+        await self._delete(f"/text_templates/{template_id}")
+
+    # --- Phonebanks & Textbanks ---
+
+    async def get_phonebanks(
+        self, limit: int = 20, offset: int = 0, since: int = 0, event_id: int | None = None
+    ) -> PaginatedResponse[Phonebank]:
+        params = self._build_params(limit, offset, since, event_id=event_id)
+        return self._parse_paginated(await self._get("/phonebanks", params=params), Phonebank)
+
+    async def get_phonebank(self, phonebank_id: int) -> Phonebank:
+        return await self._get_cached_item(f"/phonebanks/{phonebank_id}", Phonebank)
+
+    async def get_textbanks(
+        self, limit: int = 20, offset: int = 0, since: int = 0, event_id: int | None = None
+    ) -> PaginatedResponse[Textbank]:
+        params = self._build_params(limit, offset, since, event_id=event_id)
+        return self._parse_paginated(await self._get("/textbanks", params=params), Textbank)
+
+    async def get_textbank(self, textbank_id: int) -> Textbank:
+        return await self._get_cached_item(f"/textbanks/{textbank_id}", Textbank)
+
+    async def get_text_blasts(
+        self, limit: int = 20, offset: int = 0, since: int = 0
+    ) -> PaginatedResponse[TextBlast]:
+        params = self._build_params(limit, offset, since)
+        return self._parse_paginated(await self._get("/text_blasts", params=params), TextBlast)
+
+    async def get_text_blast(self, blast_id: int) -> TextBlast:
+        return await self._get_cached_item(f"/text_blasts/{blast_id}", TextBlast)
+
+    # --- Pages ---
+
+    async def get_pages(
+        self, limit: int = 20, offset: int = 0, since: int = 0
+    ) -> PaginatedResponse[Page]:
+        params = self._build_params(limit, offset, since)
+        return self._parse_paginated(await self._get("/pages", params=params), Page)
+
+    async def get_page(self, page_id: int) -> Page:
+        return await self._get_cached_item(f"/pages/{page_id}", Page)
+
+    # --- Scheduled Calls ---
+
+    async def get_scheduled_calls(
+        self, limit: int = 20, offset: int = 0, since: int = 0, user_id: int | None = None
+    ) -> PaginatedResponse[ScheduledCall]:
+        params = self._build_params(limit, offset, since, user_id=user_id)
+        return self._parse_paginated(
+            await self._get("/scheduled_calls", params=params), ScheduledCall
+        )
+
+    async def get_scheduled_call(self, call_id: int) -> ScheduledCall:
+        return await self._get_cached_item(f"/scheduled_calls/{call_id}", ScheduledCall)
+
+    # --- Field Surveys ---
+
+    async def create_field_survey_url(
+        self, user_id: int, agent_user_id: int, page_id: int
+    ) -> FieldSurveyUrlResponse:
+        payload = {"user_id": user_id, "agent_user_id": agent_user_id, "page_id": page_id}
+        return self._parse_item(
+            await self._post("/field_survey_urls", json=payload), FieldSurveyUrlResponse
+        )
+
+    # --- Task Agents & Assignments ---
+
+    async def get_task_agents(
+        self, limit: int = 20, offset: int = 0, task_id: int | None = None
+    ) -> PaginatedResponse[TaskAgent]:
+        params = self._build_params(limit, offset, task_id=task_id)
+        return self._parse_paginated(await self._get("/task_agents", params=params), TaskAgent)
+
+    async def get_task_agent(self, agent_id: int) -> TaskAgent:
+        return self._parse_item(await self._get(f"/task_agents/{agent_id}"), TaskAgent)
+
+    async def create_task_agent(self, user_id: int, task_id: int) -> TaskAgent:
+        payload = {"user_id": user_id, "task_id": task_id}
+        return self._parse_item(await self._post("/task_agents", json=payload), TaskAgent)
+
+    async def delete_task_agent(self, agent_id: int):
+        await self._delete(f"/task_agents/{agent_id}")
+
+    async def get_task_assignments(
+        self, limit: int = 20, offset: int = 0, task_id: int | None = None
+    ) -> PaginatedResponse[TaskAssignment]:
+        params = self._build_params(limit, offset, task_id=task_id)
+        return self._parse_paginated(
+            await self._get("/task_assignments", params=params), TaskAssignment
+        )
+
+    async def get_task_assignment(self, assignment_id: int) -> TaskAssignment:
+        return self._parse_item(
+            await self._get(f"/task_assignments/{assignment_id}"), TaskAssignment
+        )
+
+    async def create_task_assignment(
+        self, user_id: int, task_id: int, agent_user_id: int | None = None
+    ) -> TaskAssignment:
+        payload: dict[str, Any] = {"user_id": user_id, "task_id": task_id}
+        if agent_user_id:
+            payload["agent_user_id"] = agent_user_id
+        return self._parse_item(await self._post("/task_assignments", json=payload), TaskAssignment)
+
+    async def update_task_assignment(
+        self, assignment_id: int, agent_user_id: int
+    ) -> TaskAssignment:
+        payload = {"agent_user_id": agent_user_id}
+        return self._parse_item(
+            await self._put(f"/task_assignments/{assignment_id}", json=payload), TaskAssignment
+        )
+
+    async def delete_task_assignment(self, assignment_id: int):
+        await self._delete(f"/task_assignments/{assignment_id}")
@@ -1,7 +1,13 @@
-from typing import Any, TypeVar
+import functools
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Final, TypeVar
 
 import httpx
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import from_json, to_json
 
 from solidaritytechtools.client.models import (
     Activity,
@@ -31,6 +37,7 @@ from solidaritytechtools.client.models import (
     Organization,
     Page,
     PaginatedResponse,
+    PaginationMeta,
     Phonebank,
     RelationshipType,
     ScheduledCall,
@@ -61,57 +68,338 @@ from solidaritytechtools.client.models import (
 
 T = TypeVar("T", bound=BaseModel)
 
+JSON_HEADERS: Final[dict[str, str]] = {"Content-Type": "application/json"}
+
+DEFAULT_BASE_URL: Final[str] = "https://api.solidarity.tech/v1"
+DEFAULT_TIMEOUT: Final[float] = 30.0
+DEFAULT_CONNECT_TIMEOUT: Final[float] = 10.0
+DEFAULT_MAX_CONNECTIONS: Final[int] = 50
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS: Final[int] = 20
+DEFAULT_KEEPALIVE_EXPIRY: Final[float] = 30.0
+# Retries for failed connection attempts, backing off from DEFAULT_CONNECT_BACKOFF in between
+DEFAULT_CONNECT_RETRIES: Final[int] = 3
+DEFAULT_CONNECT_BACKOFF: Final[float] = 0.5
+# Retries for requests rejected with 429, waiting for the server's `Retry-After` in between
+DEFAULT_MAX_RETRIES: Final[int] = 3
+DEFAULT_RETRY_AFTER: Final[float] = 1.0
+# Longest Retry-After worth waiting out; longer waits fail with STRateLimitError instead
+MAX_RETRY_AFTER: Final[float] = 60.0
+# Page size used when walking every page of a list endpoint
+MAX_PAGE_SIZE: Final[int] = 100
+# Requests kept in flight at once by bulk helpers like `create_user_notes`
+DEFAULT_BULK_CONCURRENCY: Final[int] = 16
+# Pages fetched ahead of the caller once a list endpoint reports its total count
+DEFAULT_PAGE_CONCURRENCY: Final[int] = 4
+
+
+@functools.cache
+def _paginated_model(item_class: type) -> type[PaginatedResponse[Any]]:
+    """Parametrizes `PaginatedResponse` once per item class instead of on every page."""
+    return PaginatedResponse[item_class]  # type: ignore[valid-type]
+
+
+@functools.cache
+def _list_adapter(item_class: type) -> TypeAdapter[list[Any]]:
+    """Validator for bare JSON arrays of `item_class`, built once per class."""
+    return TypeAdapter(list[item_class])  # type: ignore[valid-type]
+
 
 class STError(Exception):
     """Base exception for Solidarity Tech API errors."""
 
+    # Keeps the attributes off a per-instance __dict__, which matters in rate-limit storms
+    __slots__ = ("status_code", "details")
+
     def __init__(self, message: str, status_code: int | None = None, details: Any = None):
         super().__init__(message)
         self.status_code = status_code
         self.details = details
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Slots aren't part of BaseException's default pickle state; the instance dict
+        # still carries attributes like __notes__
+        return (type(self), (*self.args, self.status_code, self.details), self.__dict__ or None)
+
 
 class STAuthError(STError):
     """Raised when authentication fails (401)."""
 
-    pass
+    __slots__ = ()
 
 
 class STNotFoundError(STError):
     """Raised when a resource is not found (404)."""
 
-    pass
+    __slots__ = ()
 
 
 class STValidationError(STError):
     """Raised when request validation fails (422)."""
 
-    pass
+    __slots__ = ()
 
 
 class STRateLimitError(STError):
     """Raised when rate limit is exceeded (429)."""
 
-    pass
+    __slots__ = ()
+
+
+# Exception class and message prefix raised for each error status
+_ERRORS_BY_STATUS: Final[dict[int, tuple[type[STError], str]]] = {
+    401: (STAuthError, "Authentication failed"),
+    404: (STNotFoundError, "Resource not found"),
+    422: (STValidationError, "Validation error"),
+    429: (STRateLimitError, "Rate limit exceeded"),
+}
+
+
+class BearerAuth(httpx.Auth):
+    """Sets the API key as a bearer token on each outgoing request."""
 
+    def __init__(self, token: str):
+        self.token = token
+        self._header = f"Bearer {token}"
+
+    def auth_flow(self, request: httpx.Request) -> Iterator[httpx.Request]:
+        request.headers["Authorization"] = self._header
+        yield request
+
+
+class BaseSTClient:
+    """Configuration and response handling shared by `STClient` and `STAsyncClient`."""
 
-class STClient:
     def __init__(
         self,
         api_key: str,
-        base_url: str = "https://api.solidarity.tech/v1",
-        timeout: float = 30.0,
+        base_url: str = DEFAULT_BASE_URL,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        cache_ttl: float | None = None,
+        trusted: bool = False,
     ):
+        """
+        `cache_ttl` enables an in-memory cache of single-record lookups (`get_user`,
+        `get_event`, ...) for that many seconds. Cached models are shared between callers,
+        so copy them before mutating. Entries loaded by `prefetch_users` or
+        `get_user_cached` are kept for the same TTL, or for the client's lifetime when no
+        TTL is set, and are then also served by `get_user`.
+
+        `trusted` builds response models with `model_construct`, skipping validation. This is
+        much faster for bulk reads, but values are left exactly as decoded from JSON: nested
+        objects stay dicts, timestamps stay strings, and missing required fields are unset.
+        """
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
-        self.client = httpx.Client(
-            base_url=self.base_url,
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Accept": "application/json",
-            },
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_retries = max_retries
+        self.cache_ttl = cache_ttl
+        self.trusted = trusted
+        # Maps request paths to (expiry on the monotonic clock or None for never, item)
+        self._read_cache: dict[str, tuple[float | None, Any]] = {}
+
+    def _client_kwargs(self) -> dict[str, Any]:
+        """
+        Arguments for the httpx client. HTTP/2 and a keep-alive pool let bulk workflows
+        reuse a single TLS connection instead of handshaking per request.
+        """
+        return {
+            "base_url": self.base_url,
+            "auth": BearerAuth(self.api_key),
+            "headers": {"Accept": "application/json"},
+            "timeout": httpx.Timeout(
+                self.timeout, connect=min(self.timeout, DEFAULT_CONNECT_TIMEOUT)
+            ),
+            "http2": True,
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=min(
+                    self.max_connections, DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+                ),
+                keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
+            ),
+        }
+
+    def _cache_lookup(self, path: str) -> Any | None:
+        if (entry := self._read_cache.get(path)) is None:
+            return None
+        expires_at, item = entry
+        if expires_at is not None and time.monotonic() > expires_at:
+            del self._read_cache[path]
+            return None
+        return item
+
+    def _cache_store(self, path: str, item: Any, pin: bool = False) -> None:
+        """
+        Caches `item` for `cache_ttl` seconds. Without a TTL, only pinned items are cached
+        (they never expire), and paths that are already cached are refreshed.
+        """
+        if self.cache_ttl:
+            self._read_cache[path] = (time.monotonic() + self.cache_ttl, item)
+        elif pin or path in self._read_cache:
+            self._read_cache[path] = (None, item)
+
+    def _should_retry(self, response: httpx.Response, attempt: int) -> bool:
+        return response.status_code == 429 and attempt < self.max_retries
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        """
+        Seconds to wait before retrying a throttled request. Honors Retry-After when the
+        server sends it, and otherwise backs off exponentially from DEFAULT_RETRY_AFTER.
+        A Retry-After above MAX_RETRY_AFTER raises STRateLimitError rather than blocking.
+        """
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                delay = max(float(retry_after), 0.0)
+            except ValueError:
+                # HTTP-date form, which the API isn't known to send
+                pass
+            else:
+                if delay > MAX_RETRY_AFTER:
+                    # Raises STRateLimitError with the server's message
+                    self._handle_response(response)
+                return delay
+        return min(DEFAULT_RETRY_AFTER * 2**attempt, MAX_RETRY_AFTER)
+
+    def _handle_response(self, response: httpx.Response) -> httpx.Response:
+        if response.is_success:
+            return response
+
+        status = response.status_code
+        message = response.text
+        details = None
+        # Skip decoding HTML error pages from proxies and load balancers
+        if "json" in response.headers.get("content-type", ""):
+            try:
+                error_data = self._decode_json(response)
+                message = error_data.get("error") or error_data.get("message") or message
+                details = error_data.get("details")
+            except Exception:
+                pass
+
+        error_class, prefix = _ERRORS_BY_STATUS.get(
+            status, (STError, f"API request failed ({status})")
+        )
+        raise error_class(f"{prefix}: {message}", status, details)
+
+    @staticmethod
+    def _to_dict(data: BaseModel | dict) -> dict[str, Any]:
+        # Calls the model's compiled serializer directly, skipping model_dump's wrapper
+        if isinstance(data, BaseModel):
+            return data.__pydantic_serializer__.to_python(data, exclude_unset=True, mode="json")
+        return data
+
+    @staticmethod
+    def _body_kwargs(json: dict | BaseModel | None) -> dict[str, Any]:
+        """
+        Request body arguments for httpx. Bodies are encoded by pydantic-core, and models
+        are serialized straight to JSON rather than dumped to an intermediate dict.
+        """
+        if json is None:
+            return {}
+        if isinstance(json, BaseModel):
+            content = json.__pydantic_serializer__.to_json(json, exclude_unset=True)
+        else:
+            content = to_json(json)
+        return {"content": content, "headers": JSON_HEADERS}
+
+    @staticmethod
+    def _decode_json(response: httpx.Response) -> Any:
+        """Decodes a response body with pydantic-core's Rust JSON parser."""
+        return from_json(response.content)
+
+    @staticmethod
+    def _build_params(
+        limit: int, offset: int, since: int | str | None = None, **filters: Any
+    ) -> dict[str, Any]:
+        params: dict[str, Any] = {"_limit": limit, "_offset": offset}
+        if since is not None:
+            params["_since"] = since
+        # Insert in place rather than building and merging a second filtered dict
+        for key, value in filters.items():
+            if value:
+                params[key] = value
+        return params
+
+    @staticmethod
+    def _is_last_page(page: PaginatedResponse[Any], fetched: int, page_size: int | None) -> bool:
+        """
+        Without a total count, a page shorter than `page_size` ends the walk. Callers pass the
+        size the server returned for the first page, since it may cap the requested limit, or
+        None to stop only on an empty page.
+        """
+        if not page.data:
+            return True
+        if page.meta and page.meta.total_count is not None:
+            return fetched >= page.meta.total_count
+        return page_size is not None and len(page.data) < page_size
+
+    @staticmethod
+    def _remaining_offsets(first_page: PaginatedResponse[Any]) -> range | None:
+        """
+        Offsets of the pages after `first_page`, stepping by the page size the server actually
+        returned. None when the endpoint doesn't report a total, so pages must be walked in turn.
+        """
+        if not first_page.meta or first_page.meta.total_count is None:
+            return None
+        step = len(first_page.data)
+        return range(step, first_page.meta.total_count, step)
+
+    def _parse_item(self, response: httpx.Response, model_class: type[T]) -> T:
+        """
+        Most endpoints wrap the item under `data`; bodies without the wrapper are parsed
+        as the item itself. The body is decoded by pydantic-core and then validated.
+        """
+        data = self._decode_json(response)
+        if isinstance(data, dict) and isinstance(data.get("data"), dict):
+            data = data["data"]
+        # Bodies that aren't objects fall through to model_validate's ValidationError
+        if self.trusted and isinstance(data, dict):
+            return model_class.model_construct(**data)  # type: ignore
+        return model_class.model_validate(data)  # type: ignore
+
+    def _parse_list(self, response: httpx.Response, item_class: type[T]) -> list[T]:
+        if self.trusted:
+            return [item_class.model_construct(**row) for row in self._decode_json(response)]  # type: ignore
+        return _list_adapter(item_class).validate_json(response.content)
+
+    def _parse_paginated(
+        self, response: httpx.Response, item_class: type[T]
+    ) -> PaginatedResponse[T]:
+        if self.trusted:
+            payload = self._decode_json(response)
+            meta = payload.get("meta")
+            return PaginatedResponse.model_construct(
+                data=[item_class.model_construct(**row) for row in payload["data"]],  # type: ignore
+                meta=PaginationMeta.model_construct(**meta) if meta else None,
+            )
+        return _paginated_model(item_class).model_validate_json(response.content)
+
+
+class STClient(BaseSTClient):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = DEFAULT_BASE_URL,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        cache_ttl: float | None = None,
+        trusted: bool = False,
+    ):
+        super().__init__(
+            api_key,
+            base_url=base_url,
             timeout=timeout,
+            max_connections=max_connections,
+            max_retries=max_retries,
+            cache_ttl=cache_ttl,
+            trusted=trusted,
         )
+        self.client = httpx.Client(**self._client_kwargs())
 
     def __enter__(self):
         return self
@@ -122,33 +410,24 @@ class STClient:
     def close(self):
         self.client.close()
 
-    def _handle_response(self, response: httpx.Response):
-        if response.is_success:
-            return response
-
-        status = response.status_code
-        try:
-            error_data = response.json()
-            message = error_data.get("error") or error_data.get("message") or response.text
-            details = error_data.get("details")
-        except Exception:
-            message = response.text
-            details = None
-
-        if status == 401:
-            raise STAuthError(f"Authentication failed: {message}", status, details)
-        elif status == 404:
-            raise STNotFoundError(f"Resource not found: {message}", status, details)
-        elif status == 422:
-            raise STValidationError(f"Validation error: {message}", status, details)
-        elif status == 429:
-            raise STRateLimitError(f"Rate limit exceeded: {message}", status, details)
-        else:
-            raise STError(f"API request failed ({status}): {message}", status, details)
+    def _request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        attempt = connect_attempt = 0
+        while True:
+            try:
+                response = self.client.request(method, path, **kwargs)
+            except httpx.ConnectError:
+                if connect_attempt >= DEFAULT_CONNECT_RETRIES:
+                    raise
+                time.sleep(DEFAULT_CONNECT_BACKOFF * 2**connect_attempt)
+                connect_attempt += 1
+                continue
+            if not self._should_retry(response, attempt):
+                return self._handle_response(response)
+            time.sleep(self._retry_delay(response, attempt))
+            attempt += 1
 
     def _get(self, path: str, params: dict | None = None) -> httpx.Response:
-        response = self.client.get(path, params=params)
-        return self._handle_response(response)
+        return self._request("GET", path, params=params)
 
     def _post(
         self,
@@ -156,60 +435,127 @@ class STClient:
         json: dict | BaseModel | None = None,
         params: dict | None = None,
     ) -> httpx.Response:
-        if isinstance(json, BaseModel):
-            json = json.model_dump(exclude_unset=True, mode="json")
-        response = self.client.post(path, json=json, params=params)
-        return self._handle_response(response)
+        return self._request("POST", path, params=params, **self._body_kwargs(json))
 
     def _put(self, path: str, json: dict | BaseModel | None = None) -> httpx.Response:
-        if isinstance(json, BaseModel):
-            json = json.model_dump(exclude_unset=True, mode="json")
-        response = self.client.put(path, json=json)
-        return self._handle_response(response)
+        return self._request("PUT", path, **self._body_kwargs(json))
 
     def _delete(self, path: str, params: dict | None = None) -> httpx.Response:
-        response = self.client.delete(path, params=params)
-        return self._handle_response(response)
+        return self._request("DELETE", path, params=params)
 
-    def _parse_item(self, response: httpx.Response, model_class: type[T]) -> T:
-        data = response.json()
-        item = data.get("data") if "data" in data and isinstance(data["data"], dict) else data
-        return model_class.model_validate(item)
+    def _get_cached_item(self, path: str, model_class: type[T], pin: bool = False) -> T:
+        if (item := self._cache_lookup(path)) is not None:
+            return item
+        item = self._parse_item(self._get(path), model_class)
+        self._cache_store(path, item, pin)
+        return item
 
-    def _parse_paginated(
-        self, response: httpx.Response, item_class: type[T]
-    ) -> PaginatedResponse[T]:
-        return PaginatedResponse[item_class].model_validate(response.json())  # type: ignore
+    def _paginate(
+        self,
+        fetch_page: Callable[..., PaginatedResponse[T]],
+        page_size: int = MAX_PAGE_SIZE,
+        concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+        **filters: Any,
+    ) -> Iterator[T]:
+        """
+        Yields every item of a list endpoint, requesting `page_size` items per round trip.
+
+        When the first page reports a total count, the remaining pages are fetched up to
+        `concurrency` at a time ahead of the caller and yielded in order.
+        """
+        page = fetch_page(limit=page_size, offset=0, **filters)
+        yield from page.data
+        offset = server_page_size = len(page.data)
+        # A short first page may just be the server capping `page_size`, so don't stop on it
+        if self._is_last_page(page, offset, None):
+            return
+
+        offsets = self._remaining_offsets(page)
+        if offsets is None or concurrency <= 1:
+            while True:
+                page = fetch_page(limit=page_size, offset=offset, **filters)
+                yield from page.data
+                offset += len(page.data)
+                if self._is_last_page(page, offset, server_page_size):
+                    return
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            pending: deque[Future[PaginatedResponse[T]]] = deque()
+            for offset in offsets:
+                pending.append(
+                    executor.submit(fetch_page, limit=page_size, offset=offset, **filters)
+                )
+                if len(pending) >= concurrency:
+                    yield from pending.popleft().result().data
+            while pending:
+                yield from pending.popleft().result().data
 
     # --- Users ---
 
     def get_users(
         self, limit: int = 20, offset: int = 0, since: int = 0, user_list_ids: str | None = None
     ) -> PaginatedResponse[User]:
-        params: dict[str, Any] = {"_limit": limit, "_offset": offset, "_since": since}
-        if user_list_ids:
-            params["user_list_ids"] = user_list_ids
+        params = self._build_params(limit, offset, since, user_list_ids=user_list_ids)
         return self._parse_paginated(self._get("/users", params=params), User)
 
+    def iter_users(
+        self, since: int = 0, user_list_ids: str | None = None, page_size: int = MAX_PAGE_SIZE
+    ) -> Iterator[User]:
+        return self._paginate(self.get_users, page_size, since=since, user_list_ids=user_list_ids)
+
+    def get_all_users(
+        self, since: int = 0, user_list_ids: str | None = None, page_size: int = MAX_PAGE_SIZE
+    ) -> list[User]:
+        return list(self.iter_users(since=since, user_list_ids=user_list_ids, page_size=page_size))
+
     def get_user(self, user_id: int) -> User:
-        return self._parse_item(self._get(f"/users/{user_id}"), User)
+        return self._get_cached_item(f"/users/{user_id}", User)
+
+    def get_users_by_ids(
+        self, user_ids: list[int], max_concurrency: int = DEFAULT_BULK_CONCURRENCY
+    ) -> list[User]:
+        """Fetches many users concurrently, with up to `max_concurrency` requests in flight."""
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            return list(executor.map(self.get_user, user_ids))
 
     def create_user(self, data: UserCreate | dict) -> User:
         return self._parse_item(self._post("/users", json=data), User)
 
     def update_user(self, user_id: int, data: UserUpdate | dict) -> User:
-        return self._parse_item(self._put(f"/users/{user_id}", json=data), User)
+        user = self._parse_item(self._put(f"/users/{user_id}", json=data), User)
+        self._cache_store(f"/users/{user_id}", user)
+        return user
+
+    def prefetch_users(self, since: int = 0, user_list_ids: str | None = None) -> None:
+        """
+        Loads users into the client's cache with a few large paginated requests, so that
+        subsequent `get_user_cached` calls don't each need their own round trip.
+        """
+        for user in self.get_all_users(since=since, user_list_ids=user_list_ids):
+            self._cache_store(f"/users/{user.id}", user, pin=True)
+
+    def get_user_cached(self, user_id: int) -> User:
+        """Returns a user from the prefetch cache, fetching (and caching) it on a miss."""
+        return self._get_cached_item(f"/users/{user_id}", User, pin=True)
 
     # --- Activities ---
 
     def get_activities(
         self, limit: int = 20, offset: int = 0, since: int = 0, user_id: int | None = None
     ) -> PaginatedResponse[Activity]:
-        params: dict[str, Any] = {"_limit": limit, "_offset": offset, "_since": since}
-        if user_id:
-            params["user_id"] = user_id
+        params = self._build_params(limit, offset, since, user_id=user_id)
         return self._parse_paginated(self._get("/activities", params=params), Activity)
 
+    def iter_activities(
+        self, since: int = 0, user_id: int | None = None, page_size: int = MAX_PAGE_SIZE
+    ) -> Iterator[Activity]:
+        return self._paginate(self.get_activities, page_size, since=since, user_id=user_id)
+
+    def get_all_activities(
+        self, since: int = 0, user_id: int | None = None, page_size: int = MAX_PAGE_SIZE
+    ) -> list[Activity]:
+        return list(self.iter_activities(since=since, user_id=user_id, page_size=page_size))
+
     # --- Agent Assignments ---
 
     def get_agent_assignments(
@@ -220,11 +566,9 @@ class STClient:
         user_id: int | None = None,
         agent_user_id: int | None = None,
     ) -> PaginatedResponse[AgentAssignment]:
-        params: dict[str, Any] = {"_limit": limit, "_offset": offset, "_since": since}
-        if user_id:
-            params["user_id"] = user_id
-        if agent_user_id:
-            params["agent_user_id"] = agent_user_id
+        params = self._build_params(
+            limit, offset, since, user_id=user_id, agent_user_id=agent_user_id
+        )
         return self._parse_paginated(
             self._get("/agent_assignments", params=params), AgentAssignment
         )
@@ -250,25 +594,31 @@ class STClient:
     def get_calls(
         self, limit: int = 20, offset: int = 0, since: int = 0, user_id: int | None = None
     ) -> PaginatedResponse[Call]:
-        params: dict[str, Any] = {"_limit": limit, "_offset": offset, "_since": since}
-        if user_id:
-            params["user_id"] = user_id
+        params = self._build_params(limit, offset, since, user_id=user_id)
         return self._parse_paginated(self._get("/calls", params=params), Call)
 
+    def iter_calls(
+        self, since: int = 0, user_id: int | None = None, page_size: int = MAX_PAGE_SIZE
+    ) -> Iterator[Call]:
+        return self._paginate(self.get_calls, page_size, since=since, user_id=user_id)
+
+    def get_all_calls(
+        self, since: int = 0, user_id: int | None = None, page_size: int = MAX_PAGE_SIZE
+    ) -> list[Call]:
+        return list(self.iter_calls(since=since, user_id=user_id, page_size=page_size))
+
     # --- Chapters ---
 
     def get_chapters(
         self, limit: int = 20, offset: int = 0, since: int = 0
     ) -> PaginatedResponse[Chapter]:
-        params: dict[str, Any] = {"_limit": limit, "_offset": offset, "_since": since}
+        params = self._build_params(limit, offset, since)
         return self._parse_paginated(self._get("/chapters", params=params), Chapter)
 
     def get_chapter_phone_numbers(
         self, limit: int = 20, offset: int = 0, since: int = 0, chapter_id: int | None = None
     ) -> PaginatedResponse[ChapterPhoneNumber]:
-        params: dict[str, Any] = {"_limit": limit, "_offset": offset, "_since": since}
-        if chapter_id:
-            params["chapter_id"] = chapter_id
+        params = self._build_params(limit, offset, since, chapter_id=chapter_id)
         return self._parse_paginated(
             self._get("/chapter_phone_numbers", params=params), ChapterPhoneNumber
         )
@@ -283,11 +633,7 @@ class STClient:
         scope_id: int | None = None,
         scope_type: str | None = None,
     ) -> PaginatedResponse[CustomUserProperty]:
-        params: dict[str, Any] = {"_limit": limit, "_offset": offset, "_since": since}
-        if scope_id:
-            params["scope_id"] = scope_id
-        if scope_type:
-            params["scope_type"] = scope_type
+        params = self._build_params(limit, offset, since, scope_id=scope_id, scope_type=scope_type)
         return self._parse_paginated(
             self._get("/custom_user_properties", params=params), CustomUserProperty
         )
@@ -320,11 +666,11 @@ class STClient:
     def get_donation_charges(
         self, limit: int = 20, offset: int = 0, since: int = 0
     ) -> PaginatedResponse[DonationCharge]:
-        params: dict[str, Any] = {"_limit": limit, "_offset": offset, "_since": since}
+        params = self._build_params(limit, offset, since)
         return self._parse_paginated(self._get("/donation_charges", params=params), DonationCharge)
 
     def get_donation_charge(self, charge_id: int) -> DonationCharge:
-        return self._parse_item(self._get(f"/donation_charges/{charge_id}"), DonationCharge)
+        return self._get_cached_item(f"/donation_charges/{charge_id}", DonationCharge)
 
     # --- Events ---
 
@@ -336,22 +682,40 @@ class STClient:
         scope_id: int | None = None,
         scope_type: str | None = None,
     ) -> PaginatedResponse[Event]:
-        params: dict[str, Any] = {"_limit": limit, "_offset": offset, "_since": since}
-        if scope_id:
-            params["scope_id"] = scope_id
-        if scope_type:
-            params["scope_type"] = scope_type
+        params = self._build_params(limit, offset, since, scope_id=scope_id, scope_type=scope_type)
         return self._parse_paginated(self._get("/events", params=params), Event)
 
+    def iter_events(
+        self,
+        since: int = 0,
+        scope_id: int | None = None,
+        scope_type: str | None = None,
+        page_size: int = MAX_PAGE_SIZE,
+    ) -> Iterator[Event]:
+        return self._paginate(
+            self.get_events, page_size, since=since, scope_id=scope_id, scope_type=scope_type
+        )
+
+    def get_all_events(
+        self,
+        since: int = 0,
+        scope_id: int | None = None,
+        scope_type: str | None = None,
+        page_size: int = MAX_PAGE_SIZE,
+    ) -> list[Event]:
+        return list(
+            self.iter_events(
+                since=since, scope_id=scope_id, scope_type=scope_type, page_size=page_size
+            )
+        )
+
     def get_event(self, event_id: int) -> Event:
-        return self._parse_item(self._get(f"/events/{event_id}"), Event)
+        return self._get_cached_item(f"/events/{event_id}", Event)
 
     def get_event_sessions(
         self, limit: int = 20, offset: int = 0, since: int = 0, event_id: int | None = None
     ) -> PaginatedResponse[EventSession]:
-        params: dict[str, Any] = {"_limit": limit, "_offset": offset, "_since": since}
-        if event_id:
-            params["event_id"] = event_id
+        params = self._build_params(limit, offset, since, event_id=event_id)
         return self._parse_paginated(self._get("/event_sessions", params=params), EventSession)
 
     def get_event_session(self, session_id: int) -> EventSession:
@@ -376,13 +740,33 @@ class STClient:
         event_id: int | None = None,
         session_id: int | None = None,
     ) -> PaginatedResponse[EventRsvp]:
-        params: dict[str, Any] = {"_limit": limit, "_offset": offset, "_since": since}
-        if event_id:
-            params["event_id"] = event_id
-        if session_id:
-            params["session_id"] = session_id
+        params = self._build_params(limit, offset, since, event_id=event_id, session_id=session_id)
         return self._parse_paginated(self._get("/event_rsvps", params=params), EventRsvp)
 
+    def iter_event_rsvps(
+        self,
+        since: int = 0,
+        event_id: int | None = None,
+        session_id: int | None = None,
+        page_size: int = MAX_PAGE_SIZE,
+    ) -> Iterator[EventRsvp]:
+        return self._paginate(
+            self.get_event_rsvps, page_size, since=since, event_id=event_id, session_id=session_id
+        )
+
+    def get_all_event_rsvps(
+        self,
+        since: int = 0,
+        event_id: int | None = None,
+        session_id: int | None = None,
+        page_size: int = MAX_PAGE_SIZE,
+    ) -> list[EventRsvp]:
+        return list(
+            self.iter_event_rsvps(
+                since=since, event_id=event_id, session_id=session_id, page_size=page_size
+            )
+        )
+
     def get_event_rsvp(self, rsvp_id: int) -> EventRsvp:
         return self._parse_item(self._get(f"/event_rsvps/{rsvp_id}"), EventRsvp)
 
@@ -403,15 +787,39 @@ class STClient:
         event_id: int | None = None,
         session_id: int | None = None,
     ) -> PaginatedResponse[EventAttendance]:
-        params: dict[str, Any] = {"_limit": limit, "_offset": offset, "_since": since}
-        if event_id:
-            params["event_id"] = event_id
-        if session_id:
-            params["session_id"] = session_id
+        params = self._build_params(limit, offset, since, event_id=event_id, session_id=session_id)
         return self._parse_paginated(
             self._get("/event_attendances", params=params), EventAttendance
         )
 
+    def iter_event_attendances(
+        self,
+        since: int = 0,
+        event_id: int | None = None,
+        session_id: int | None = None,
+        page_size: int = MAX_PAGE_SIZE,
+    ) -> Iterator[EventAttendance]:
+        return self._paginate(
+            self.get_event_attendances,
+            page_size,
+            since=since,
+            event_id=event_id,
+            session_id=session_id,
+        )
+
+    def get_all_event_attendances(
+        self,
+        since: int = 0,
+        event_id: int | None = None,
+        session_id: int | None = None,
+        page_size: int = MAX_PAGE_SIZE,
+    ) -> list[EventAttendance]:
+        return list(
+            self.iter_event_attendances(
+                since=since, event_id=event_id, session_id=session_id, page_size=page_size
+            )
+        )
+
     def create_event_attendance(self, data: EventAttendanceCreate | dict) -> EventAttendance:
         return self._parse_item(self._post("/event_attendances", json=data), EventAttendance)
 
@@ -428,11 +836,7 @@ class STClient:
         user_id: int | None = None,
         page_id: int | None = None,
     ) -> PaginatedResponse[Any]:
-        params: dict[str, Any] = {"_limit": limit, "_offset": offset, "_since": since}
-        if user_id:
-            params["user_id"] = user_id
-        if page_id:
-            params["page_id"] = page_id
+        params = self._build_params(limit, offset, since, user_id=user_id, page_id=page_id)
         # Spec doesn't define response schema for GET /user_actions, assuming paginated
         return self._parse_paginated(self._get("/user_actions", params=params), BaseModel)
 
@@ -448,13 +852,19 @@ class STClient:
         since: str | None = None,
         user_id: int | None = None,
     ) -> PaginatedResponse[Text]:
-        params: dict[str, Any] = {"_limit": limit, "_offset": offset}
-        if since:
-            params["_since"] = since
-        if user_id:
-            params["user_id"] = user_id
+        params = self._build_params(limit, offset, since, user_id=user_id)
         return self._parse_paginated(self._get("/texts", params=params), Text)
 
+    def iter_texts(
+        self, since: str | None = None, user_id: int | None = None, page_size: int = MAX_PAGE_SIZE
+    ) -> Iterator[Text]:
+        return self._paginate(self.get_texts, page_size, since=since, user_id=user_id)
+
+    def get_all_texts(
+        self, since: str | None = None, user_id: int | None = None, page_size: int = MAX_PAGE_SIZE
+    ) -> list[Text]:
+        return list(self.iter_texts(since=since, user_id=user_id, page_size=page_size))
+
     def create_text(self, user_id: int, body: str, media_urls: list[str] | None = None):
         params: dict[str, Any] = {"user_id": user_id, "body": body}
         if media_urls:
@@ -466,26 +876,24 @@ class STClient:
         self._post("/emails", params=params)
 
     def get_email_senders(self, limit: int = 20, offset: int = 0) -> PaginatedResponse[EmailSender]:
-        params: dict[str, Any] = {"_limit": limit, "_offset": offset}
+        params = self._build_params(limit, offset)
         return self._parse_paginated(self._get("/email_senders", params=params), EmailSender)
 
     def get_email_blasts(
         self, limit: int = 20, offset: int = 0, since: int = 0
     ) -> PaginatedResponse[EmailBlast]:
-        params: dict[str, Any] = {"_limit": limit, "_offset": offset, "_since": since}
+        params = self._build_params(limit, offset, since)
         return self._parse_paginated(self._get("/email_blasts", params=params), EmailBlast)
 
     def get_email_blast(self, blast_id: int) -> EmailBlast:
-        return self._parse_item(self._get(f"/email_blasts/{blast_id}"), EmailBlast)
+        return self._get_cached_item(f"/email_blasts/{blast_id}", EmailBlast)
 
     # --- Scheduled Tasks ---
 
     def get_scheduled_tasks(
         self, limit: int = 20, offset: int = 0, since: int = 0, user_id: int | None = None
     ) -> PaginatedResponse[ScheduledTask]:
-        params: dict[str, Any] = {"_limit": limit, "_offset": offset, "_since": since}
-        if user_id:
-            params["user_id"] = user_id
+        params = self._build_params(limit, offset, since, user_id=user_id)
         return self._parse_paginated(self._get("/scheduled_tasks", params=params), ScheduledTask)
 
     def get_scheduled_task(self, task_id: int) -> ScheduledTask:
@@ -505,11 +913,28 @@ class STClient:
     # --- User Notes ---
 
     def create_user_note(self, data: UserNoteCreate | dict):
-        if isinstance(data, BaseModel):
-            payload = data.model_dump(exclude_unset=True, mode="json")
-        else:
-            payload = data
-        self._post("/user_notes", params=payload)
+        self._post("/user_notes", params=self._to_dict(data))
+
+    def create_user_notes(
+        self, notes: list[UserNoteCreate | dict], max_concurrency: int = DEFAULT_BULK_CONCURRENCY
+    ) -> list[tuple[UserNoteCreate | dict, Exception | None]]:
+        """
+        Creates many notes concurrently, with up to `max_concurrency` requests in flight.
+
+        Returns each note paired with the error raised while creating it (or None on success),
+        so a single failure doesn't abort the rest of the batch.
+        """
+        create_user_note = self.create_user_note
+
+        def create(note: UserNoteCreate | dict) -> Exception | None:
+            try:
+                create_user_note(note)
+            except (STError, httpx.HTTPError) as e:
+                return e
+            return None
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            return list(zip(notes, executor.map(create, notes), strict=True))
 
     def delete_user_note(self, note_id: int, user_id: int):
         self._delete(f"/user_notes/{note_id}", params={"user_id": user_id})
@@ -519,11 +944,11 @@ class STClient:
     def get_organizations(
         self, limit: int = 20, offset: int = 0, since: int = 0
     ) -> PaginatedResponse[Organization]:
-        params: dict[str, Any] = {"_limit": limit, "_offset": offset, "_since": since}
+        params = self._build_params(limit, offset, since)
         return self._parse_paginated(self._get("/organizations", params=params), Organization)
 
     def get_organization(self, org_id: int) -> Organization:
-        return self._parse_item(self._get(f"/organizations/{org_id}"), Organization)
+        return self._get_cached_item(f"/organizations/{org_id}", Organization)
 
     # --- Automations ---
 
@@ -535,7 +960,7 @@ class STClient:
     def get_user_lists(
         self, limit: int = 20, offset: int = 0, since: int = 0
     ) -> PaginatedResponse[UserList]:
-        params: dict[str, Any] = {"_limit": limit, "_offset": offset, "_since": since}
+        params = self._build_params(limit, offset, since)
         return self._parse_paginated(self._get("/user_lists", params=params), UserList)
 
     def create_user_list(self, data: UserListCreate | dict) -> UserList:
@@ -554,13 +979,10 @@ class STClient:
 
     def get_relationship_types(self, user_id: int) -> list[RelationshipType]:
         response = self._get("/user_relationships", params={"user_id": user_id})
-        return [RelationshipType.model_validate(item) for item in response.json()]
+        return self._parse_list(response, RelationshipType)
 
     def create_user_relationship(self, data: UserRelationshipCreate | dict):
-        self._post(
-            "/user_relationships",
-            params=data if isinstance(data, dict) else data.model_dump(mode="json"),
-        )
+        self._post("/user_relationships", params=self._to_dict(data))
 
     def delete_user_relationship(self, relationship_id: int, user_id: int):
         self._delete(f"/user_relationships/{relationship_id}", params={"user_id": user_id})
@@ -570,7 +992,7 @@ class STClient:
     def get_team_members(
         self, limit: int = 20, offset: int = 0, since: int = 0
     ) -> PaginatedResponse[TeamMember]:
-        params: dict[str, Any] = {"_limit": limit, "_offset": offset, "_since": since}
+        params = self._build_params(limit, offset, since)
         return self._parse_paginated(self._get("/team_members", params=params), TeamMember)
 
     def create_team_member(self, data: TeamMemberCreate | dict) -> TeamMember:
@@ -584,9 +1006,7 @@ class STClient:
     def get_text_templates(
         self, limit: int = 20, offset: int = 0, since: int = 0, event_id: int | None = None
     ) -> PaginatedResponse[TextTemplate]:
-        params: dict[str, Any] = {"_limit": limit, "_offset": offset, "_since": since}
-        if event_id:
-            params["event_id"] = event_id
+        params = self._build_params(limit, offset, since, event_id=event_id)
         return self._parse_paginated(self._get("/text_templates", params=params), TextTemplate)
 
     def get_text_template(self, template_id: int) -> TextTemplate:
@@ -610,57 +1030,51 @@ class STClient:
     def get_phonebanks(
         self, limit: int = 20, offset: int = 0, since: int = 0, event_id: int | None = None
     ) -> PaginatedResponse[Phonebank]:
-        params: dict[str, Any] = {"_limit": limit, "_offset": offset, "_since": since}
-        if event_id:
-            params["event_id"] = event_id
+        params = self._build_params(limit, offset, since, event_id=event_id)
         return self._parse_paginated(self._get("/phonebanks", params=params), Phonebank)
 
     def get_phonebank(self, phonebank_id: int) -> Phonebank:
-        return self._parse_item(self._get(f"/phonebanks/{phonebank_id}"), Phonebank)
+        return self._get_cached_item(f"/phonebanks/{phonebank_id}", Phonebank)
 
     def get_textbanks(
         self, limit: int = 20, offset: int = 0, since: int = 0, event_id: int | None = None
     ) -> PaginatedResponse[Textbank]:
-        params: dict[str, Any] = {"_limit": limit, "_offset": offset, "_since": since}
-        if event_id:
-            params["event_id"] = event_id
+        params = self._build_params(limit, offset, since, event_id=event_id)
         return self._parse_paginated(self._get("/textbanks", params=params), Textbank)
 
     def get_textbank(self, textbank_id: int) -> Textbank:
-        return self._parse_item(self._get(f"/textbanks/{textbank_id}"), Textbank)
+        return self._get_cached_item(f"/textbanks/{textbank_id}", Textbank)
 
     def get_text_blasts(
         self, limit: int = 20, offset: int = 0, since: int = 0
     ) -> PaginatedResponse[TextBlast]:
-        params: dict[str, Any] = {"_limit": limit, "_offset": offset, "_since": since}
+        params = self._build_params(limit, offset, since)
         return self._parse_paginated(self._get("/text_blasts", params=params), TextBlast)
 
     def get_text_blast(self, blast_id: int) -> TextBlast:
-        return self._parse_item(self._get(f"/text_blasts/{blast_id}"), TextBlast)
+        return self._get_cached_item(f"/text_blasts/{blast_id}", TextBlast)
 
     # --- Pages ---
 
     def get_pages(
         self, limit: int = 20, offset: int = 0, since: int = 0
     ) -> PaginatedResponse[Page]:
-        params: dict[str, Any] = {"_limit": limit, "_offset": offset, "_since": since}
+        params = self._build_params(limit, offset, since)
         return self._parse_paginated(self._get("/pages", params=params), Page)
 
     def get_page(self, page_id: int) -> Page:
-        return self._parse_item(self._get(f"/pages/{page_id}"), Page)
+        return self._get_cached_item(f"/pages/{page_id}", Page)
 
     # --- Scheduled Calls ---
 
     def get_scheduled_calls(
         self, limit: int = 20, offset: int = 0, since: int = 0, user_id: int | None = None
     ) -> PaginatedResponse[ScheduledCall]:
-        params: dict[str, Any] = {"_limit": limit, "_offset": offset, "_since": since}
-        if user_id:
-            params["user_id"] = user_id
+        params = self._build_params(limit, offset, since, user_id=user_id)
         return self._parse_paginated(self._get("/scheduled_calls", params=params), ScheduledCall)
 
     def get_scheduled_call(self, call_id: int) -> ScheduledCall:
-        return self._parse_item(self._get(f"/scheduled_calls/{call_id}"), ScheduledCall)
+        return self._get_cached_item(f"/scheduled_calls/{call_id}", ScheduledCall)
 
     # --- Field Surveys ---
 
@@ -677,9 +1091,7 @@ class STClient:
     def get_task_agents(
         self, limit: int = 20, offset: int = 0, task_id: int | None = None
     ) -> PaginatedResponse[TaskAgent]:
-        params: dict[str, Any] = {"_limit": limit, "_offset": offset}
-        if task_id:
-            params["task_id"] = task_id
+        params = self._build_params(limit, offset, task_id=task_id)
         return self._parse_paginated(self._get("/task_agents", params=params), TaskAgent)
 
     def get_task_agent(self, agent_id: int) -> TaskAgent:
@@ -695,9 +1107,7 @@ class STClient:
     def get_task_assignments(
         self, limit: int = 20, offset: int = 0, task_id: int | None = None
     ) -> PaginatedResponse[TaskAssignment]:
-        params: dict[str, Any] = {"_limit": limit, "_offset": offset}
-        if task_id:
-            params["task_id"] = task_id
+        params = self._build_params(limit, offset, task_id=task_id)
         return self._parse_paginated(self._get("/task_assignments", params=params), TaskAssignment)
 
     def get_task_assignment(self, assignment_id: int) -> TaskAssignment:
@@ -358,7 +358,16 @@ class RelationshipType(BaseModel):
 # --- Request Models (Create/Update) ---
 
 
-class UserCreate(BaseModel):
+class RequestModel(BaseModel):
+    """
+    Base for request payloads. Most are only built by a few call sites, so their validators
+    are built on first use rather than at import.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+
+class UserCreate(RequestModel):
     phone_number: str | None = None
     email: str | None = None
     first_name: str | None = None
@@ -380,7 +389,7 @@ class UserCreate(BaseModel):
     phone_number_textable_validation: bool | None = None
 
 
-class UserUpdate(BaseModel):
+class UserUpdate(RequestModel):
     phone_number: str | None = None
     email: str | None = None
     first_name: str | None = None
@@ -401,24 +410,24 @@ class UserUpdate(BaseModel):
     timezone: str | None = None
 
 
-class AgentAssignmentCreate(BaseModel):
+class AgentAssignmentCreate(RequestModel):
     user_id: int
     agent_user_id: int
     is_active: bool | None = True
 
 
-class AgentAssignmentUpdate(BaseModel):
+class AgentAssignmentUpdate(RequestModel):
     user_id: int | None = None
     agent_user_id: int | None = None
     is_active: bool | None = None
 
 
-class AutomationEnrollmentCreate(BaseModel):
+class AutomationEnrollmentCreate(RequestModel):
     automation_id: int
     user_id: int
 
 
-class CustomUserPropertyCreate(BaseModel):
+class CustomUserPropertyCreate(RequestModel):
     label: str
     description: str | None = None
     field_type: Literal[
@@ -429,12 +438,12 @@ class CustomUserPropertyCreate(BaseModel):
     scope_id: int
 
 
-class CustomUserPropertyOptionCreate(BaseModel):
+class CustomUserPropertyOptionCreate(RequestModel):
     label: dict[str, str]
     value: str | None = None
 
 
-class EventSessionCreate(BaseModel):
+class EventSessionCreate(RequestModel):
     event_id: int
     start_time: int
     end_time: int
@@ -448,7 +457,7 @@ class EventSessionCreate(BaseModel):
     tags: list[str] | None = None
 
 
-class EventSessionUpdate(BaseModel):
+class EventSessionUpdate(RequestModel):
     start_time: int | None = None
     end_time: int | None = None
     title: str | None = None
@@ -461,7 +470,7 @@ class EventSessionUpdate(BaseModel):
     tags: list[str] | None = None
 
 
-class EventRsvpCreate(BaseModel):
+class EventRsvpCreate(RequestModel):
     event_id: int
     event_session_id: int
     user_id: int
@@ -473,7 +482,7 @@ class EventRsvpCreate(BaseModel):
     skip_email_confirmation: bool | None = False
 
 
-class EventRsvpUpdate(BaseModel):
+class EventRsvpUpdate(RequestModel):
     is_attending: Literal["yes", "no", "maybe"] | None = None
     is_confirmed: bool | None = None
     agent_user_id: int | None = None
@@ -481,14 +490,14 @@ class EventRsvpUpdate(BaseModel):
     source_system: str | None = None
 
 
-class EventAttendanceCreate(BaseModel):
+class EventAttendanceCreate(RequestModel):
     event_id: int
     event_session_id: int
     user_id: int
     attended: bool
 
 
-class ScheduledTaskCreate(BaseModel):
+class ScheduledTaskCreate(RequestModel):
     due_at: str | int
     remind_at: str | int | None = None
     agent_user_id: int | None = None
@@ -497,7 +506,7 @@ class ScheduledTaskCreate(BaseModel):
     marked_as_completed: bool | None = False
 
 
-class ScheduledTaskUpdate(BaseModel):
+class ScheduledTaskUpdate(RequestModel):
     due_at: str | int | None = None
     remind_at: str | int | None = None
     agent_user_id: int | None = None
@@ -506,7 +515,7 @@ class ScheduledTaskUpdate(BaseModel):
     marked_as_completed: bool | None = None
 
 
-class TeamMemberCreate(BaseModel):
+class TeamMemberCreate(RequestModel):
     member_id: str | None = None
     phone_number: str | None = None
     email: str | None = None
@@ -520,13 +529,13 @@ class TeamMemberCreate(BaseModel):
     task_id: int | None = None
 
 
-class TeamMemberUpdate(BaseModel):
+class TeamMemberUpdate(RequestModel):
     role_id: int
     scope_type: ScopeType
     scope_id: int
 
 
-class TextTemplateCreate(BaseModel):
+class TextTemplateCreate(RequestModel):
     name: str
     scope_id: int
     scope_type: ScopeType
@@ -534,7 +543,7 @@ class TextTemplateCreate(BaseModel):
     event_id: int | None = None
 
 
-class TextTemplateUpdate(BaseModel):
+class TextTemplateUpdate(RequestModel):
     name: str | None = None
     scope_id: int | None = None
     scope_type: ScopeType | None = None
@@ -542,7 +551,7 @@ class TextTemplateUpdate(BaseModel):
     event_id: int | None = None
 
 
-class UserListCreate(BaseModel):
+class UserListCreate(RequestModel):
     name: str
     scope_id: int
     scope_type: ScopeType
@@ -551,7 +560,7 @@ class UserListCreate(BaseModel):
     parameters: dict[str, Any]
 
 
-class UserListUpdate(BaseModel):
+class UserListUpdate(RequestModel):
     name: str | None = None
     scope_id: int | None = None
     scope_type: ScopeType | None = None
@@ -559,14 +568,14 @@ class UserListUpdate(BaseModel):
     event_id: int | None = None
 
 
-class UserNoteCreate(BaseModel):
+class UserNoteCreate(RequestModel):
     user_id: int
     agent_id: int | None = None
     content: str
     created_at: int | None = None
 
 
-class UserActionData(BaseModel):
+class UserActionData(RequestModel):
     phone_number: str | None = None
     email: str | None = None
     first_name: str | None = None
@@ -581,14 +590,14 @@ class UserActionData(BaseModel):
     custom_user_properties: dict[str, str] | None = None
 
 
-class UserActionCreate(BaseModel):
+class UserActionCreate(RequestModel):
     page_id: int
     user_id: int | None = None
     created_at: int | None = None
     data: UserActionData | None = None
 
 
-class UserRelationshipCreate(BaseModel):
+class UserRelationshipCreate(RequestModel):
     user_id: int
     related_user_id: int
     relationship_type: str
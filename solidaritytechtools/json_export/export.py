@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
-from pydantic import RootModel, ValidationError
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import from_json
 
 from solidaritytechtools.json_export.models import Person
 
@@ -16,10 +16,27 @@ class STJsonExportValidationError(STJsonExportError):
     """Raised when the ST JSON export file does not have the expected format."""
 
 
-class STJsonExportModel(RootModel[list[Person]]):
-    """Represents a root-level list of Person objects from an ST export."""
+# Validator for the root-level list of Person objects in an ST export, built once at import
+_PEOPLE_ADAPTER: TypeAdapter[list[Person]] = TypeAdapter(list[Person])
 
-    root: list[Person]
+
+def load_json_export[T](path: Path | str, adapter: TypeAdapter[list[T]]) -> list[T]:
+    """
+    Loads an ST JSON export and validates its rows with `adapter`. Passing an adapter over a
+    model with only some of the Person fields skips validating everything else.
+    """
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"Export file not found: {path}")
+
+    try:
+        # Exports always use the hyphenated aliases, so skip matching on field names too;
+        # see STJsonExport.from_path for what that means for rows keyed by field name
+        return adapter.validate_json(path.read_bytes(), by_name=False)
+    except ValidationError as e:
+        raise STJsonExportValidationError(
+            f"ST json export file does not have expected format: {e}"
+        ) from e
 
 
 class STJsonExport:
@@ -27,23 +44,35 @@ class STJsonExport:
         self.people = people
 
     @classmethod
-    def from_path(cls, path: Path | str) -> STJsonExport:
+    def from_path(cls, path: Path | str, *, trusted: bool = False) -> STJsonExport:
         """
         Loads and validates an ST JSON export from a file path.
+
+        Fields are read by their export keys only, e.g. `membership-status`. Although `Person`
+        sets `populate_by_name`, a row that uses the Python name (`membership_status`) instead
+        leaves that field at its default, and the key is dropped rather than kept as an extra.
+
+        `trusted` skips validation and builds each Person with `model_construct`, which is much
+        faster for large exports that are known to be well-formed. Nested records (texts, calls,
+        notes) are then left as plain dicts and timestamps are not parsed.
         """
         path = Path(path)
         if not path.exists():
             raise FileNotFoundError(f"Export file not found: {path}")
 
-        try:
-            model = STJsonExportModel.model_validate_json(path.read_text())
-            return cls(people=model.root)
-        except ValidationError as e:
-            raise STJsonExportValidationError(
-                f"ST json export file does not have expected format: {e}"
-            ) from e
-        except json.JSONDecodeError as e:
-            raise STJsonExportValidationError(f"Invalid JSON in export file: {e}") from e
+        if trusted:
+            try:
+                rows = from_json(path.read_bytes())
+            except ValueError as e:
+                raise STJsonExportValidationError(f"Invalid JSON in export file: {e}") from e
+            if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+                raise STJsonExportValidationError(
+                    "ST json export file does not have expected format: "
+                    "expected a list of person objects"
+                )
+            return cls(people=[Person.model_construct(**row) for row in rows])
+
+        return cls(people=load_json_export(path, _PEOPLE_ADAPTER))
 
 
 def get_persons_from_json_export(path: Path | str) -> list[Person]:
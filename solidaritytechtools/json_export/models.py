@@ -1,7 +1,7 @@
 """Models of how data is represneted in the ST JSON export"""
 
 from datetime import datetime
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -26,10 +26,6 @@ class Note(BaseModel):
     updated_at: datetime
 
 
-class Donation(BaseModel):
-    model_config = ConfigDict(extra="allow")
-
-
 class Person(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
@@ -81,4 +77,5 @@ class Person(BaseModel):
     texts: list[TextMessage] = Field(default_factory=list)
     calls: list[CallRecord] = Field(default_factory=list)
     notes: list[Note] = Field(default_factory=list)
-    donations: list[Donation] = Field(default_factory=list)
+    # Donation records have no fixed schema in the export, so they're kept as plain dicts
+    donations: list[dict[str, Any]] = Field(default_factory=list)
@@ -1,19 +1,40 @@
 import logging
-import re
+import operator
+import sys
+from collections import defaultdict
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Final
 
+from pydantic import BaseModel, TypeAdapter
 from pydantic.dataclasses import dataclass
 
 import solidaritytechtools.client.models as client_models
 import solidaritytechtools.json_export.models as json_export_models
 from solidaritytechtools.client.base_client import STClient
-from solidaritytechtools.json_export.export import STJsonExport
+from solidaritytechtools.json_export.export import load_json_export
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_CONFIDENCE_THRESHOLD: Final[float] = 0.8
 
+_BY_CONFIDENCE: Final = operator.attrgetter("confidence")
+
+
+class _NonDigitDeleter(dict[int, int | None]):
+    """
+    `str.translate` table that deletes every non-digit character. Entries are filled in lazily
+    per code point, so it matches the Unicode semantics of `re.sub(r"\\D", "", ...)`.
+    """
+
+    def __missing__(self, codepoint: int) -> int | None:
+        value = codepoint if chr(codepoint).isdecimal() else None
+        self[codepoint] = value
+        return value
+
+
+_NON_DIGIT_DELETER: Final = _NonDigitDeleter()
+
 
 @dataclass
 class ClientUserMatch:
@@ -21,11 +42,33 @@ class ClientUserMatch:
     confidence: float
 
 
+class _MatchFields(BaseModel):
+    """
+    The fields of an exported Person that matching reads. Everything else, such as the
+    texts/calls/notes history, is skipped instead of being validated into models.
+    """
+
+    id: int
+    first_name: str
+    last_name: str
+    phone_number: str | None = None
+    email: str | None = None
+    postal_code: str | None = None
+
+
+_MATCH_FIELDS_ADAPTER: Final = TypeAdapter(list[_MatchFields])
+
+
+def _load_match_fields(json_export_file: Path | str) -> list[_MatchFields]:
+    logger.info(f"Load people from json export file from {json_export_file}")
+    return load_json_export(json_export_file, _MATCH_FIELDS_ADAPTER)
+
+
 def _normalize_phone(phone: str | None) -> str | None:
     if not phone:
         return None
     # Strip all non-digits
-    digits = re.sub(r"\D", "", phone)
+    digits = phone.translate(_NON_DIGIT_DELETER)
     # Handle US country code if present (e.g., 14145551234 -> 4145551234)
     if len(digits) == 11 and digits.startswith("1"):
         return digits[1:]
@@ -44,6 +87,145 @@ def _normalize_name(name: str | None) -> str:
     return name.strip().lower()
 
 
+def _user_zip(user: client_models.User) -> str:
+    if user.address and hasattr(user.address, "zip_code"):
+        return (user.address.zip_code or "").strip()
+    elif isinstance(user.address, dict):
+        return str(user.address.get("zip_code", "")).strip()
+    return ""
+
+
+class _UserIndex:
+    """Blocking index of client users by email, phone and name, built incrementally."""
+
+    def __init__(self) -> None:
+        # Keys are tagged with their kind so an email, a phone and a name can never collide
+        self.blocks: defaultdict[tuple[str, ...], list[int]] = defaultdict(list)
+        # Zip codes of name-indexed users, resolved once rather than per candidate pair
+        self.user_zips: dict[int, str] = {}
+
+    def add(self, users: Iterable[client_models.User]) -> None:
+        blocks = self.blocks
+        for user in users:
+            # Index by Email
+            if email := _normalize_email(user.email):
+                blocks[("email", email)].append(user.id)
+
+            # Index by Phone
+            if phone := _normalize_phone(user.phone_number):
+                blocks[("phone", phone)].append(user.id)
+
+            # Index by First + Last Name
+            fname = _normalize_name(user.first_name)
+            lname = _normalize_name(user.last_name)
+            if fname and lname:
+                # Common first/last names recur across many keys, so store one copy of each
+                blocks[("name", sys.intern(fname), sys.intern(lname))].append(user.id)
+                self.user_zips[user.id] = _user_zip(user)
+
+    def match(
+        self,
+        json_persons: Iterable[json_export_models.Person | _MatchFields],
+        threshold: float,
+    ) -> dict[int, list[ClientUserMatch]]:
+        blocks = self.blocks
+        results: dict[int, list[ClientUserMatch]] = {}
+
+        for person in json_persons:
+            # Tracks user_id -> highest confidence found for this person
+            candidates: dict[int, float] = {}
+
+            p_email = _normalize_email(person.email)
+            p_phone = _normalize_phone(person.phone_number)
+            p_fname = _normalize_name(person.first_name)
+            p_lname = _normalize_name(person.last_name)
+            p_zip = (person.postal_code or "").strip()
+
+            # Check Email Matches (Confidence 1.0)
+            if p_email:
+                for uid in blocks.get(("email", p_email), ()):
+                    candidates[uid] = 1.0
+
+            # Check Phone Matches (Confidence 1.0)
+            if p_phone:
+                for uid in blocks.get(("phone", p_phone), ()):
+                    candidates[uid] = 1.0
+
+            # Check Name Matches
+            if p_fname and p_lname:
+                for uid in blocks.get(("name", p_fname, p_lname), ()):
+                    # Users already matched on email/phone are at 1.0 and can't score higher
+                    if uid in candidates:
+                        continue
+
+                    # If Name matches, check Zip Code for higher confidence
+                    if p_zip and p_zip == self.user_zips[uid]:
+                        candidates[uid] = 0.9  # Name + Zip
+                    else:
+                        candidates[uid] = 0.7  # Name only
+
+            # Filter by threshold and sort
+            person_matches = [
+                ClientUserMatch(user_id=uid, confidence=conf)
+                for uid, conf in candidates.items()
+                if conf >= threshold
+            ]
+
+            if person_matches:
+                # Sort matches by confidence descending; most persons have a single match
+                if len(person_matches) > 1:
+                    person_matches.sort(key=_BY_CONFIDENCE, reverse=True)
+                results[person.id] = person_matches
+
+        return results
+
+    def match_best(
+        self,
+        json_persons: Iterable[json_export_models.Person | _MatchFields],
+        threshold: float,
+    ) -> dict[int, ClientUserMatch | None]:
+        """
+        Same result as taking the first entry of each `match()` list, but only tracks the
+        current best candidate per person, and stops looking once it finds a 1.0 match.
+        Ties go to the candidate seen first, as with `match()`'s stable sort.
+        """
+        blocks = self.blocks
+        results: dict[int, ClientUserMatch | None] = {}
+
+        for person in json_persons:
+            best_uid = 0
+            best_conf = 0.0
+
+            p_email = _normalize_email(person.email)
+            p_phone = _normalize_phone(person.phone_number)
+
+            # Email and phone hits can't be beaten, so the first one wins outright
+            if p_email and (uids := blocks.get(("email", p_email))):
+                best_uid, best_conf = uids[0], 1.0
+            elif p_phone and (uids := blocks.get(("phone", p_phone))):
+                best_uid, best_conf = uids[0], 1.0
+            else:
+                p_fname = _normalize_name(person.first_name)
+                p_lname = _normalize_name(person.last_name)
+                p_zip = (person.postal_code or "").strip()
+                if p_fname and p_lname:
+                    for uid in blocks.get(("name", p_fname, p_lname), ()):
+                        # If Name matches, check Zip Code for higher confidence
+                        if p_zip and p_zip == self.user_zips[uid]:
+                            best_uid, best_conf = uid, 0.9  # Name + Zip
+                            break
+                        if best_conf < 0.7:
+                            best_uid, best_conf = uid, 0.7  # Name only
+
+            if best_conf and best_conf >= threshold:
+                results[person.id] = ClientUserMatch(user_id=best_uid, confidence=best_conf)
+            else:
+                # Like match(), an unmatched duplicate id keeps an earlier duplicate's match
+                results.setdefault(person.id, None)
+
+        return results
+
+
 def match_persons(
     json_persons: list[json_export_models.Person],
     client_users: list[client_models.User],
@@ -55,79 +237,21 @@ def match_persons(
 
     Returns a mapping of Person.id -> list of ClientUserMatch objects.
     """
-    # 1. Build indices for client_users to avoid O(N*M)
-    email_map: dict[str, list[client_models.User]] = {}
-    phone_map: dict[str, list[client_models.User]] = {}
-    name_map: dict[tuple[str, str], list[client_models.User]] = {}
-
-    for user in client_users:
-        # Index by Email
-        if email := _normalize_email(user.email):
-            email_map.setdefault(email, []).append(user)
-
-        # Index by Phone
-        if phone := _normalize_phone(user.phone_number):
-            phone_map.setdefault(phone, []).append(user)
+    # 1. Build a single blocking index over client_users to avoid O(N*M)
+    index = _UserIndex()
+    index.add(client_users)
 
-        # Index by First + Last Name
-        fname = _normalize_name(user.first_name)
-        lname = _normalize_name(user.last_name)
-        if fname and lname:
-            name_map.setdefault((fname, lname), []).append(user)
+    # 2. Iterate through persons and find candidates
+    return index.match(json_persons, threshold)
 
-    results: dict[int, list[ClientUserMatch]] = {}
 
-    # 2. Iterate through persons and find candidates
-    for person in json_persons:
-        # Tracks user_id -> highest confidence found for this person
-        candidates: dict[int, float] = {}
-
-        p_email = _normalize_email(person.email)
-        p_phone = _normalize_phone(person.phone_number)
-        p_fname = _normalize_name(person.first_name)
-        p_lname = _normalize_name(person.last_name)
-        p_zip = (person.postal_code or "").strip()
-
-        # Check Email Matches (Confidence 1.0)
-        if p_email and p_email in email_map:
-            for u in email_map[p_email]:
-                candidates[u.id] = max(candidates.get(u.id, 0), 1.0)
-
-        # Check Phone Matches (Confidence 1.0)
-        if p_phone and p_phone in phone_map:
-            for u in phone_map[p_phone]:
-                candidates[u.id] = max(candidates.get(u.id, 0), 1.0)
-
-        # Check Name Matches
-        if p_fname and p_lname and (p_fname, p_lname) in name_map:
-            for u in name_map[(p_fname, p_lname)]:
-                # If Name matches, check Zip Code for higher confidence
-                u_zip = ""
-                if u.address and hasattr(u.address, "zip_code"):
-                    u_zip = (u.address.zip_code or "").strip()
-                elif isinstance(u.address, dict):
-                    u_zip = str(u.address.get("zip_code", "")).strip()
-
-                if p_zip and u_zip and p_zip == u_zip:
-                    conf = 0.9  # Name + Zip
-                else:
-                    conf = 0.7  # Name only
-
-                candidates[u.id] = max(candidates.get(u.id, 0), conf)
-
-        # 3. Filter by threshold and sort
-        person_matches = [
-            ClientUserMatch(user_id=uid, confidence=conf)
-            for uid, conf in candidates.items()
-            if conf >= threshold
-        ]
-
-        if person_matches:
-            # Sort matches by confidence descending
-            person_matches.sort(key=lambda x: x.confidence, reverse=True)
-            results[person.id] = person_matches
-
-    return results
+def _index_api_users(api_key: str) -> _UserIndex:
+    # Index users page by page as they arrive, so the full user list is never held in memory
+    index = _UserIndex()
+    with STClient(api_key=api_key) as client:
+        logger.info("Fetching all users from api")
+        index.add(client.iter_users())
+    return index
 
 
 def find_matches(
@@ -137,35 +261,9 @@ def find_matches(
     Convenience function that loads a JSON export, fetches all users from the API,
     and returns a mapping of matches.
     """
-    logger.info(f"Load people from json export file from {json_export_file}")
-    export = STJsonExport.from_path(json_export_file)
-    json_persons = export.people
+    json_persons = _load_match_fields(json_export_file)
 
-    all_users: list[client_models.User] = []
-    with STClient(api_key=api_key) as client:
-        limit = 100
-        offset = 0
-        while True:
-            logger.info(f"Fetching users from api limit={limit} offset={offset}")
-            response = client.get_users(limit=limit, offset=offset)
-            if not response.data:
-                break
-
-            all_users.extend(response.data)
-
-            # Check if we've reached the end based on total_count
-            if response.meta and response.meta.total_count is not None:
-                if len(all_users) >= response.meta.total_count:
-                    break
-
-            # Safety break if we got less than requested
-            if len(response.data) < limit:
-                break
-
-            offset += limit
-
-    # 3. Perform matching
-    return match_persons(json_persons, all_users, threshold=threshold)
+    return _index_api_users(api_key).match(json_persons, threshold)
 
 
 def find_best_match(
@@ -175,15 +273,7 @@ def find_best_match(
     Returns a dictionary mapping Person ID to the single best ClientUserMatch found,
     or None if no match meets the threshold.
     """
-    all_matches = find_matches(json_export_file, api_key, threshold=threshold)
-
-    # Load exported persons to ensure we return an entry for everyone in the export
-    export = STJsonExport.from_path(json_export_file)
-    results: dict[int, ClientUserMatch | None] = {p.id: None for p in export.people}
-
-    # Since find_matches returns matches sorted by confidence, just take the first one
-    for person_id, matches in all_matches.items():
-        if matches:
-            results[person_id] = matches[0]
+    json_persons = _load_match_fields(json_export_file)
 
-    return results
+    # Only the top match per person is needed, so skip building and sorting full lists
+    return _index_api_users(api_key).match_best(json_persons, threshold)